@@ -8,6 +8,7 @@ import os
 import json
 import asyncio
 import subprocess
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -18,6 +19,15 @@ sys.stderr = os.fdopen(sys.stderr.fileno(), 'w', 0)
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath('.'))
 
+# Single precompiled row template for the per-URL network summary – one
+# format_map call instead of several small f-strings per URL.
+NETWORK_ROW_FMT = (
+    "   DNS Resolution: {dns_icon}\n"
+    "   TCP Connection: {tcp_icon}\n"
+    "   Open Ports: {open_port_count} found\n"
+    "   Overall: {overall}"
+)
+
 class DiagnosticReport:
     def __init__(self):
         self.report_data = {
@@ -88,9 +98,10 @@ class DiagnosticReport:
             ('https://frontend.dynadock.lan', 'Frontend Local Domain'),
             ('https://mailhog.dynadock.lan', 'MailHog Local Domain')
         ]
-        
-        network_results = {}
-        
+
+        # Pre-size with the case names so no rehash fires while filling
+        network_results = dict.fromkeys(name for _, name in test_cases)
+
         try:
             from src.dynadock.testing.network_analyzer import analyze_network_connectivity
             
@@ -100,22 +111,29 @@ class DiagnosticReport:
                 
                 try:
                     result = analyze_network_connectivity(url, verbose=True)
-                    
-                    dns_ok = result.get('dns_resolution', {}).get('success', False)
+
+                    # Hoist the dict lookups once per URL instead of chaining
+                    # .get calls through the formatting below.
+                    dns_info = result.get('dns_resolution') or {}
+                    dns_ok = dns_info.get('success', False)
                     tcp_ok = result.get('tcp_connect', False)
                     port_scan = result.get('port_scan', {})
                     open_ports = [p for p, status in port_scan.items() if status]
-                    
-                    self.print_with_flush(f"   DNS Resolution: {'✅' if dns_ok else '❌'}")
+                    timing = result.get('timing', {})
+                    network_detected = dns_ok or tcp_ok or bool(open_ports)
+
+                    self.print_with_flush(NETWORK_ROW_FMT.format_map({
+                        'dns_icon': '✅' if dns_ok else '❌',
+                        'tcp_icon': '✅' if tcp_ok else '❌',
+                        'open_port_count': len(open_ports),
+                        'overall': '✅ NETWORK DETECTED' if network_detected else '❌ NO NETWORK',
+                    }))
                     if dns_ok:
-                        ip = result.get('dns_resolution', {}).get('ip', 'Unknown')
+                        ip = dns_info.get('ip', 'Unknown')
                         self.print_with_flush(f"      → {result['hostname']} resolves to {ip}")
-                    
-                    self.print_with_flush(f"   TCP Connection: {'✅' if tcp_ok else '❌'}")
-                    self.print_with_flush(f"   Open Ports: {len(open_ports)} found")
                     if open_ports:
                         self.print_with_flush(f"      → {sorted(open_ports)}")
-                    
+
                     # SSL info for HTTPS
                     if url.startswith('https'):
                         ssl_info = result.get('ssl_cert_info')
@@ -125,18 +143,13 @@ class DiagnosticReport:
                             self.print_with_flush(f"      → CN: {subject.get('commonName', 'Unknown')}")
                         else:
                             self.print_with_flush(f"   SSL Certificate: ❌")
-                    
+
                     # Timing information
-                    timing = result.get('timing', {})
                     if timing:
                         self.print_with_flush(f"   Performance:")
                         for operation, time_val in timing.items():
                             self.print_with_flush(f"      → {operation}: {time_val:.3f}s")
-                    
-                    network_detected = dns_ok or tcp_ok or bool(open_ports)
-                    status = "✅ NETWORK DETECTED" if network_detected else "❌ NO NETWORK"
-                    self.print_with_flush(f"   Overall: {status}")
-                    
+
                     network_results[name] = {
                         'url': url,
                         'dns_success': dns_ok,
@@ -172,74 +185,88 @@ class DiagnosticReport:
             ('https://frontend.dynadock.lan', 'Frontend Local Domain'),
             ('https://mailhog.dynadock.lan', 'MailHog Local Domain')
         ]
-        
-        browser_results = {}
-        
+
+        # Pre-size with the case names so no rehash fires while filling
+        browser_results = dict.fromkeys(name for _, name in test_cases)
+
         try:
             from src.dynadock.testing.browser_tester import test_domain_headless, setup_screenshots_dir
             
             # Setup screenshots directory
             screenshots_dir = setup_screenshots_dir()
             self.print_with_flush(f"📁 Screenshots directory: {screenshots_dir}")
-            
-            for i, (url, name) in enumerate(test_cases, 1):
+
+            # Run the browser tests concurrently but bounded – each test spins
+            # up a Chromium context, so an unbounded gather can OOM.
+            sem = asyncio.Semaphore(
+                int(os.getenv('DYNADOCK_BROWSER_CONCURRENCY', '4'))
+            )
+
+            async def guarded_test(url):
+                async with sem:
+                    return await test_domain_headless(url, timeout=10, verbose=True)
+
+            outcomes = await asyncio.gather(
+                *(guarded_test(url) for url, _ in test_cases),
+                return_exceptions=True,
+            )
+
+            for i, ((url, name), result) in enumerate(zip(test_cases, outcomes), 1):
                 self.print_with_flush(f"\n🔍 Browser Test {i}: {name}")
                 self.print_with_flush(f"   URL: {url}")
-                
-                try:
-                    result = await test_domain_headless(url, timeout=10, verbose=True)
-                    
-                    if result['success']:
-                        self.print_with_flush(f"   Status: ✅ SUCCESS")
-                        self.print_with_flush(f"   HTTP Code: {result.get('status', 'N/A')}")
-                        self.print_with_flush(f"   Load Time: {result.get('load_time', 0):.3f}s")
-                        
-                        # Screenshot info
-                        screenshot_path = result.get('screenshot_path')
-                        if screenshot_path and Path(screenshot_path).exists():
-                            size_kb = Path(screenshot_path).stat().st_size // 1024
-                            self.print_with_flush(f"   Screenshot: {Path(screenshot_path).name} ({size_kb} KB)")
-                        
-                        # Network requests and logs
-                        network_requests = result.get('network_requests', [])
-                        console_logs = result.get('console_logs', [])
-                        errors = result.get('errors', [])
-                        ssl_errors = result.get('ssl_errors', [])
-                        
-                        self.print_with_flush(f"   Network Requests: {len(network_requests)}")
-                        self.print_with_flush(f"   Console Logs: {len(console_logs)}")
-                        self.print_with_flush(f"   Errors: {len(errors)}")
-                        self.print_with_flush(f"   SSL Errors: {len(ssl_errors)}")
-                        
-                        browser_results[name] = {
-                            'url': url,
-                            'success': True,
-                            'http_status': result.get('status'),
-                            'load_time': result.get('load_time', 0),
-                            'screenshot_captured': screenshot_path is not None,
-                            'network_requests': len(network_requests),
-                            'console_logs': len(console_logs),
-                            'errors': len(errors),
-                            'ssl_errors': len(ssl_errors)
-                        }
-                    else:
-                        self.print_with_flush(f"   Status: ❌ FAILED")
-                        self.print_with_flush(f"   Error: {result.get('error', 'Unknown')}")
-                        
-                        browser_results[name] = {
-                            'url': url,
-                            'success': False,
-                            'error': result.get('error', 'Unknown')
-                        }
-                    
-                except Exception as e:
-                    self.print_with_flush(f"   ❌ Browser test error: {e}")
+
+                if isinstance(result, Exception):
+                    self.print_with_flush(f"   ❌ Browser test error: {result}")
                     browser_results[name] = {
                         'url': url,
                         'success': False,
-                        'error': str(e)
+                        'error': str(result)
                     }
-            
+                elif result['success']:
+                    self.print_with_flush(f"   Status: ✅ SUCCESS")
+                    self.print_with_flush(f"   HTTP Code: {result.get('status', 'N/A')}")
+                    self.print_with_flush(f"   Load Time: {result.get('load_time', 0):.3f}s")
+
+                    # Screenshot info
+                    screenshot_path = result.get('screenshot_path')
+                    if screenshot_path and Path(screenshot_path).exists():
+                        size_kb = Path(screenshot_path).stat().st_size // 1024
+                        self.print_with_flush(f"   Screenshot: {Path(screenshot_path).name} ({size_kb} KB)")
+
+                    # Network requests and logs
+                    network_count = result.get('network_requests_count',
+                                               len(result.get('network_requests', [])))
+                    console_logs = result.get('console_logs', [])
+                    errors = result.get('errors', [])
+                    ssl_errors = result.get('ssl_errors', [])
+
+                    self.print_with_flush(f"   Network Requests: {network_count}")
+                    self.print_with_flush(f"   Console Logs: {len(console_logs)}")
+                    self.print_with_flush(f"   Errors: {len(errors)}")
+                    self.print_with_flush(f"   SSL Errors: {len(ssl_errors)}")
+
+                    browser_results[name] = {
+                        'url': url,
+                        'success': True,
+                        'http_status': result.get('status'),
+                        'load_time': result.get('load_time', 0),
+                        'screenshot_captured': screenshot_path is not None,
+                        'network_requests': network_count,
+                        'console_logs': len(console_logs),
+                        'errors': len(errors),
+                        'ssl_errors': len(ssl_errors)
+                    }
+                else:
+                    self.print_with_flush(f"   Status: ❌ FAILED")
+                    self.print_with_flush(f"   Error: {result.get('error', 'Unknown')}")
+
+                    browser_results[name] = {
+                        'url': url,
+                        'success': False,
+                        'error': result.get('error', 'Unknown')
+                    }
+
+
             self.report_data['browser_tests'] = browser_results
             return len([r for r in browser_results.values() if r.get('success', False)]) > 0
             
@@ -372,21 +399,33 @@ class DiagnosticReport:
 
 async def main():
     """Main diagnostic function"""
+    # Eager task factory (3.12+) runs each coroutine synchronously until its
+    # first real suspension, cutting scheduling latency for the short-lived
+    # probe tasks fanned out below.
+    if hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     report = DiagnosticReport()
-    
+
+    # Stamp wall-clock time once; duration reporting uses monotonic deltas so
+    # it stays correct even if the wall clock jumps mid-run.
+    start_dt = datetime.now()
+    start_mono = time.monotonic()
+
     # Run all diagnostic phases
-    report.print_with_flush(f"⏰ Started: {datetime.now().strftime('%H:%M:%S')}")
-    
+    report.print_with_flush(f"⏰ Started: {start_dt.strftime('%H:%M:%S')}")
+
     system_ok = report.collect_system_info()
     network_ok = report.test_network_connectivity()
     browser_ok = await report.test_browser_functionality()
     services_ok = report.test_service_availability()
-    
+
     # Generate summary and save report
     report.generate_summary(system_ok, network_ok, browser_ok, services_ok)
     report_file = report.save_json_report()
-    
-    report.print_with_flush(f"⏰ Completed: {datetime.now().strftime('%H:%M:%S')}")
+
+    elapsed = time.monotonic() - start_mono
+    report.print_with_flush(f"⏰ Completed after {elapsed:.1f}s")
     
     return all([system_ok, network_ok, browser_ok, services_ok])
 
@@ -117,8 +117,9 @@ async def test_browser_with_screenshot(url, domain_name):
                 print(f"   ❌ Zrzut ekranu: Nie utworzono")
             
             # Network requests
-            network_requests = result.get('network_requests', [])
-            print(f"   🌐 Żądania sieciowe: {len(network_requests)}")
+            network_count = result.get('network_requests_count',
+                                       len(result.get('network_requests', [])))
+            print(f"   🌐 Żądania sieciowe: {network_count}")
             
             # Console logs
             console_logs = result.get('console_logs', [])
@@ -216,7 +216,8 @@ async def detailed_browser_test(url, case_name):
             
             # Network requests analysis
             network_requests = result.get('network_requests', [])
-            print(f"   🌐 Żądania sieciowe: {len(network_requests)}")
+            network_count = result.get('network_requests_count', len(network_requests))
+            print(f"   🌐 Żądania sieciowe: {network_count}")
             for i, req in enumerate(network_requests[:5], 1):
                 print(f"      {i}. {req.get('method', 'GET')} {req.get('url', 'Unknown')}")
             
@@ -382,11 +383,14 @@ async def main():
         print(f"   🌐 Curl: {'✅' if result['curl_ok'] else '❌'}")
         print()
     
-    # Statistics
-    total_success = sum(1 for r in results if r['overall_success'])
-    network_success = sum(1 for r in results if r['network_ok'])
-    browser_success = sum(1 for r in results if r['browser_ok'])
-    curl_success = sum(1 for r in results if r['curl_ok'])
+    # Statistics – built in a single pass over results instead of one
+    # generator scan per counter
+    total_success = network_success = browser_success = curl_success = 0
+    for r in results:
+        total_success += r['overall_success']
+        network_success += r['network_ok']
+        browser_success += r['browser_ok']
+        curl_success += r['curl_ok']
     
     print(f"📊 STATYSTYKI KOŃCOWE:")
     print(f"   🎯 Pełny sukces: {total_success}/{len(results)} ({(total_success/len(results)*100):.1f}%)")
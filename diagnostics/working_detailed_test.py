@@ -81,8 +81,9 @@ async def test_browser_case(url, case_name):
                 print(f"   📸 Zrzut ekranu: {Path(screenshot).name} ({size_kb} KB)")
             
             # Network requests
-            requests = result.get('network_requests', [])
-            print(f"   🌐 Żądania HTTP: {len(requests)}")
+            requests_count = result.get('network_requests_count',
+                                        len(result.get('network_requests', [])))
+            print(f"   🌐 Żądania HTTP: {requests_count}")
             
             # Console logs and errors
             console_logs = result.get('console_logs', [])
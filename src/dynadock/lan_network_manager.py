@@ -19,6 +19,12 @@ from .log_config import setup_logging
 
 logger = logging.getLogger("dynadock.lan_network")
 
+# Compiled once at import - these run on every network-details lookup and
+# MAC resolution, so skip even the re._cache hit per call.
+_INET_RE = re.compile(r"inet (\d+\.\d+\.\d+\.\d+)/(\d+)")
+_LLADDR_RE = re.compile(r"lladdr\s+([0-9a-f:]{17})", flags=re.IGNORECASE)
+_ARP_AT_RE = re.compile(r"\bat\s+([0-9a-f:]{17})\b")
+
 
 class LANNetworkManager:
     """Manages virtual IPs visible across the entire local network"""
@@ -122,8 +128,7 @@ class LANNetworkManager:
             result = subprocess.check_output(cmd, shell=False, text=True)  # nosec B603 - Controlled command, necessary for system interaction
 
             # Extract IP and subnet mask
-            ip_pattern = r"inet (\d+\.\d+\.\d+\.\d+)/(\d+)"
-            match = re.search(ip_pattern, result)
+            match = _INET_RE.search(result)
 
             if match:
                 ip = match.group(1)
@@ -450,7 +455,7 @@ class LANNetworkManager:
             out = subprocess.check_output(
                 ["ip", "neigh", "show", ip_address], shell=False, text=True  # nosec B603 - Controlled IP input, necessary for network testing
             ).strip()
-            m = re.search(r"lladdr\s+([0-9a-f:]{17})", out, flags=re.IGNORECASE)
+            m = _LLADDR_RE.search(out)
             if m:
                 return m.group(1).lower()
         except subprocess.CalledProcessError:
@@ -467,7 +472,7 @@ class LANNetworkManager:
                 .strip()
                 .lower()
             )
-            m = re.search(r"\bat\s+([0-9a-f:]{17})\b", out)
+            m = _ARP_AT_RE.search(out)
             if m:
                 return m.group(1)
         except subprocess.CalledProcessError:
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import errno
+import functools
 import logging
+import os
+import re
 import shutil
+import socket
 import subprocess
+import sys
+import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from pathlib import Path
 
@@ -12,13 +19,66 @@ __all__ = ["PreflightChecker", "PreflightReport"]
 
 logger = logging.getLogger(__name__)
 
+# Hard cap on each probe so a hung daemon or sudo prompt bounds the
+# whole preflight instead of blocking it forever.
+try:
+    _PROBE_TIMEOUT = float(os.environ.get("DYNADOCK_PREFLIGHT_TIMEOUT", "2"))
+except ValueError:
+    _PROBE_TIMEOUT = 2.0
 
-@dataclass
+# Shared kwargs for every diagnostic subprocess.run call: capture text
+# output, never raise on non-zero exit, detach stdin so probes cannot
+# block on a tty, skip the close-fds walk these short-lived read-only
+# commands don't need, and bound each probe's runtime.
+_RUN_KW = dict(
+    capture_output=True,
+    text=True,
+    check=False,
+    stdin=subprocess.DEVNULL,
+    close_fds=False,
+    timeout=_PROBE_TIMEOUT,
+)
+
+
+# Registry of recurring static hints, interned so repeated appends share
+# one string object and membership checks hit the pointer-equality fast
+# path. Dynamic, per-port detail lines stay as plain formatted strings.
+SUGGESTIONS = {
+    "free-port-80": sys.intern(
+        "Use 'make free-port-80' or stop the conflicting process/container."
+    ),
+    "dns-conflict": sys.intern(
+        "Port 53 conflict prevents local DNS – Dynadock will fallback to --manage-hosts."
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Cached ``shutil.which`` - the PATH walk stats every entry per lookup."""
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _compose_plugin_available() -> bool:
+    """Probe the 'docker compose' plugin once per process."""
+    try:
+        p = subprocess.run(["docker", "compose", "version"], **_RUN_KW)  # nosec B603 - Controlled command for Docker interaction
+        return p.returncode == 0
+    except Exception:
+        return False
+
+
+@dataclass(slots=True)
 class PreflightReport:
     ok: bool
     warnings: List[str]
     errors: List[str]
     suggestions: List[str]
+    # Stable machine-readable finding ids ("docker-missing",
+    # "port-80-in-use", ...) mirroring the human-readable messages -
+    # callers test membership here instead of substring-scanning lists.
+    tokens: FrozenSet[str] = frozenset()
 
     def pretty(self) -> str:
         lines: List[str] = []
@@ -36,23 +96,116 @@ class PreflightReport:
         return "\n".join(lines)
 
 
-def _port_in_use(port: int, proto: str = "tcp") -> Tuple[bool, str]:
-    # Try ss first
+_PROC_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+_PROC_UDP = ("/proc/net/udp", "/proc/net/udp6")
+_TCP_LISTEN_STATE = "0A"
+
+
+def _read_proc_net(path: str) -> Optional[str]:
+    """Read one /proc/net socket table; ``None`` when unavailable."""
     try:
-        flags = "-ltnp" if proto == "tcp" else "-lunp"
-        p = subprocess.run(["ss", flags], capture_output=True, text=True, check=False)  # nosec B603 - Controlled command for port checking
-        if p.returncode == 0 and str(port) in p.stdout:
-            return True, p.stdout
-    except FileNotFoundError:
+        return Path(path).read_text()
+    except OSError:
+        return None
+
+
+def _ports_from_proc(paths: Tuple[str, ...], state: Optional[str]) -> Optional[set]:
+    """Collect local ports from /proc/net tables - no subprocess at all.
+
+    ``state`` filters TCP sockets to LISTEN; UDP tables pass ``None``
+    and accept every bound socket. Returns ``None`` when no table could
+    be read, so callers fall back to the ss snapshot.
+    """
+    ports: Optional[set] = None
+    for path in paths:
+        text = _read_proc_net(path)
+        if text is None:
+            continue
+        if ports is None:
+            ports = set()
+        for line in text.splitlines()[1:]:
+            fields = line.split()
+            if len(fields) < 4:
+                continue
+            if state is not None and fields[3] != state:
+                continue
+            ports.add(int(fields[1].rsplit(":", 1)[1], 16))
+    return ports
+
+
+def _listening_snapshot() -> Tuple[Optional[str], Optional[str]]:
+    """Capture the TCP and UDP listening-socket tables with one ss call each.
+
+    Returns ``(tcp_output, udp_output)``; a table is ``None`` when ss is
+    unavailable or failed, in which case callers fall back to lsof. One
+    batched snapshot replaces a fork/exec per inspected port.
+    """
+    tcp = udp = None
+    try:
+        p = subprocess.run(["ss", "-Htnlp"], **_RUN_KW)  # nosec B603 - Controlled command for port checking
+        if p.returncode == 0:
+            tcp = p.stdout
+        p = subprocess.run(["ss", "-Hunlp"], **_RUN_KW)  # nosec B603 - Controlled command for port checking
+        if p.returncode == 0:
+            udp = p.stdout
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
-    # Fallback to lsof
+    return tcp, udp
+
+
+# Local-address port in ss output ("*:80", "0.0.0.0:53", "[::]:443").
+# Peer addresses of listening sockets are "*:*" and never match.
+_SS_PORT_RE = re.compile(r":(\d+)\b")
+
+
+def _ports_from_ss(output: Optional[str]) -> Optional[set]:
+    """Local ports in an ss snapshot - one finditer pass over the whole
+    capture instead of a split/strip per line per inspected port."""
+    if output is None:
+        return None
+    return {int(m.group(1)) for m in _SS_PORT_RE.finditer(output)}
+
+
+def _lines_for_port(output: str, port: int) -> List[str]:
+    """Return the socket-table lines whose local address ends in *port*."""
+    suffix = f":{port}"
+    lines: List[str] = []
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) >= 4 and fields[3].endswith(suffix):
+            lines.append(line)
+    return lines
+
+
+def _port_busy(port: int, proto: str = "tcp") -> Optional[bool]:
+    """Bind-probe a port - one syscall, no subprocess, portable off Linux.
+
+    SO_REUSEADDR keeps lingering TIME_WAIT sockets from reading as busy.
+    Returns ``None`` when the probe is inconclusive (e.g. EACCES binding
+    a privileged port as non-root), so callers can try another tool
+    rather than report a false conflict.
+    """
+    fam, typ = (
+        (socket.AF_INET, socket.SOCK_STREAM)
+        if proto == "tcp"
+        else (socket.AF_INET, socket.SOCK_DGRAM)
+    )
+    with socket.socket(fam, typ) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(("0.0.0.0", port))
+            return False
+        except OSError as e:
+            return True if e.errno == errno.EADDRINUSE else None
+
+
+def _lsof_port(port: int) -> Tuple[bool, str]:
+    """Last-resort per-port probe when neither /proc nor ss is usable."""
     try:
-        p2 = subprocess.run(
-            ["lsof", f"-i:{port}"], capture_output=True, text=True, check=False  # nosec B603 - Controlled command for port checking
-        )
+        p2 = subprocess.run(["lsof", f"-i:{port}"], **_RUN_KW)  # nosec B603 - Controlled command for port checking
         if p2.returncode == 0 and p2.stdout.strip():
             return True, p2.stdout
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
     return False, ""
 
@@ -60,35 +213,67 @@ def _port_in_use(port: int, proto: str = "tcp") -> Tuple[bool, str]:
 class PreflightChecker:
     """Environment checks before running dynadock up."""
 
+    # Reports cached per (project dir, PATH, 30s time bucket): one CLI
+    # invocation chaining subcommands pays for the probes once, while a
+    # changed PATH or the TTL expiring forces a fresh inspection.
+    _REPORT_TTL = 30.0
+    _report_cache: ClassVar[Dict[tuple, PreflightReport]] = {}
+
     def __init__(self, project_dir: Path) -> None:
         self.project_dir = Path(project_dir)
+        # Drop memoized environment probes so this checker re-inspects a
+        # possibly changed PATH (and tests see their patched lookups).
+        _which.cache_clear()
+        _compose_plugin_available.cache_clear()
         logger.info("PreflightChecker initialized")
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop cached reports so the next run() re-probes everything."""
+        cls._report_cache.clear()
+
     def run(self) -> PreflightReport:
+        key = (
+            self.project_dir,
+            os.environ.get("PATH", ""),
+            int(time.monotonic() // self._REPORT_TTL),
+        )
+        cached = self._report_cache.get(key)
+        if cached is not None:
+            logger.info("Reusing preflight report from the last %ss", self._REPORT_TTL)
+            return cached
+        report = self._run_checks()
+        # Expired buckets never match again - keep only the fresh entry.
+        self._report_cache.clear()
+        self._report_cache[key] = report
+        return report
+
+    def _run_checks(self) -> PreflightReport:
+        # Bound after any test monkeypatching, so patched lookups still
+        # apply; locals save the global+attribute lookup per call below.
+        run = subprocess.run
+        which = _which
+
         warnings: List[str] = []
         errors: List[str] = []
         suggestions: List[str] = []
+        tokens: Set[str] = set()
 
         logger.info("Running preflight checks...")
 
         # Binaries
         for bin_name in ("docker", "ip", "curl"):
-            if shutil.which(bin_name) is None:
+            if which(bin_name) is None:
                 errors.append(f"Required binary not found: {bin_name}")
                 suggestions.append(f"Install {bin_name} and ensure it's on PATH")
+                tokens.add(f"{bin_name}-missing")
 
         # docker-compose or docker compose plugin
         compose_ok = False
-        if shutil.which("docker-compose") is not None:
+        if which("docker-compose") is not None:
             compose_ok = True
-        elif shutil.which("docker") is not None:
-            try:
-                subprocess.run(
-                    ["docker", "compose", "version"], check=True, capture_output=True  # nosec B603 - Controlled command for Docker interaction
-                )
-                compose_ok = True
-            except Exception:
-                pass
+        elif which("docker") is not None:
+            compose_ok = _compose_plugin_available()
         if not compose_ok:
             errors.append(
                 "Neither docker-compose nor 'docker compose' plugin is available"
@@ -96,101 +281,157 @@ class PreflightChecker:
             suggestions.append(
                 "Install docker-compose or Docker Compose plugin (e.g. 'docker compose')"
             )
+            tokens.add("compose-missing")
 
         # Optional: resolvectl
-        if shutil.which("resolvectl") is None:
+        if which("resolvectl") is None:
             warnings.append(
                 "systemd-resolved (resolvectl) not found – DNS stub domain may not be configured automatically."
             )
             suggestions.append(
                 "Consider installing or enable fallback via --manage-hosts"
             )
+            tokens.add("resolvectl-missing")
 
         # Docker accessibility
-        if shutil.which("docker") is not None:
-            p = subprocess.run(
-                ["docker", "ps"], capture_output=True, text=True, check=False  # nosec B603 - Controlled command for Docker interaction
-            )
-            if p.returncode != 0:
+        if which("docker") is not None:
+            try:
+                p = run(["docker", "ps"], **_RUN_KW)  # nosec B603 - Controlled command for Docker interaction
+                docker_ok = p.returncode == 0
+            except subprocess.TimeoutExpired:
+                docker_ok = False
+                warnings.append(
+                    f"'docker ps' did not answer within {_PROBE_TIMEOUT}s."
+                )
+            if not docker_ok:
                 errors.append(
                     "Cannot communicate with Docker daemon (docker ps failed)"
                 )
                 suggestions.append(
                     "Ensure your user is in the 'docker' group or Docker is running"
                 )
+                tokens.add("docker-unreachable")
 
         # Passwordless sudo (for veth and DNS setup)
         logger.info("Checking for passwordless sudo...")
-        try:
-            sp = subprocess.run(["sudo", "-n", "true"], check=False)  # nosec B603 - Controlled command for sudo check
-            if sp.returncode != 0:
-                errors.append(
-                    "Passwordless sudo is required for network setup. It is not available."
-                )
-                suggestions.append(
-                    "To enable, run 'sudo visudo' and add the following line, replacing 'your_username' with your actual username:"
-                )
-                suggestions.append(
-                    "    your_username ALL=(ALL) NOPASSWD: /usr/bin/ip, /usr/bin/python3"
-                )
-                suggestions.append(
-                    "Alternatively, use the --manage-hosts flag to run without virtual networking."
-                )
-            else:
-                logger.info("✅ Passwordless sudo is available.")
-        except Exception:
+        # Skip the spawn entirely when sudo is not even on PATH.
+        sudo_failed = which("sudo") is None
+        if not sudo_failed:
+            try:
+                sp = run(["sudo", "-n", "true"], **_RUN_KW)  # nosec B603 - Controlled command for sudo check
+                if sp.returncode != 0:
+                    errors.append(
+                        "Passwordless sudo is required for network setup. It is not available."
+                    )
+                    suggestions.append(
+                        "To enable, run 'sudo visudo' and add the following line, replacing 'your_username' with your actual username:"
+                    )
+                    suggestions.append(
+                        "    your_username ALL=(ALL) NOPASSWD: /usr/bin/ip, /usr/bin/python3"
+                    )
+                    suggestions.append(
+                        "Alternatively, use the --manage-hosts flag to run without virtual networking."
+                    )
+                    tokens.add("sudo-password-required")
+                else:
+                    logger.info("✅ Passwordless sudo is available.")
+            except Exception:
+                sudo_failed = True
+        if sudo_failed:
             warnings.append(
                 "Sudo not available – some features will be degraded (no veth/DNS). Use --manage-hosts fallback."
             )
+            tokens.add("sudo-missing")
 
         # Ports
         logger.info("Checking for port conflicts...")
         # ss/lsof availability note
-        if shutil.which("ss") is None and shutil.which("lsof") is None:
+        if which("ss") is None and which("lsof") is None:
             warnings.append(
                 "Neither 'ss' nor 'lsof' found – port usage checks may be unreliable."
             )
             suggestions.append(
                 "Install 'ss' (iproute2) or 'lsof' to enable better port diagnostics."
             )
+            tokens.add("port-tools-missing")
+
+        # Fast path on Linux: a pure /proc read instead of spawning ss.
+        tcp_ports = udp_ports = None
+        if sys.platform == "linux":
+            tcp_ports = _ports_from_proc(_PROC_TCP, _TCP_LISTEN_STATE)
+            udp_ports = _ports_from_proc(_PROC_UDP, None)
+        tcp_snapshot = udp_snapshot = None
+        if (tcp_ports is None or udp_ports is None) and which("ss") is not None:
+            tcp_snapshot, udp_snapshot = _listening_snapshot()
+            if tcp_ports is None:
+                tcp_ports = _ports_from_ss(tcp_snapshot)
+            if udp_ports is None:
+                udp_ports = _ports_from_ss(udp_snapshot)
 
         for port in (80, 443, 53):
             logger.debug(f"Checking port {port}...")
-            in_use, detail = _port_in_use(port, "tcp" if port != 53 else "udp")
+            ports_set = tcp_ports if port != 53 else udp_ports
+            snapshot = tcp_snapshot if port != 53 else udp_snapshot
+            if ports_set is not None:
+                in_use = port in ports_set
+                detail = (
+                    "\n".join(_lines_for_port(snapshot, port))
+                    if in_use and snapshot
+                    else ""
+                )
+            else:
+                # No socket table at all (e.g. macOS without ss): a
+                # single bind syscall answers busy/free, with lsof kept
+                # for inconclusive probes and process detail.
+                busy = _port_busy(port, "tcp" if port != 53 else "udp")
+                if busy is None:
+                    if which("lsof") is not None:
+                        in_use, detail = _lsof_port(port)
+                    else:
+                        in_use, detail = False, ""
+                else:
+                    in_use, detail = busy, ""
+                    if busy and which("lsof") is not None:
+                        _, detail = _lsof_port(port)
             if in_use:
                 warnings.append(f"Port {port} appears to be in use.")
+                tokens.add(f"port-{port}-in-use")
                 if detail:
                     suggestions.append(f"Check processes using port {port}:")
                     suggestions.extend(
                         [f"    {line}" for line in detail.splitlines()[:5]]
                     )
                 if port in (80, 443):
-                    suggestions.append(
-                        "Use 'make free-port-80' or stop the conflicting process/container."
-                    )
+                    hint = SUGGESTIONS["free-port-80"]
+                    if hint not in suggestions:
+                        suggestions.append(hint)
                 if port == 53:
-                    suggestions.append(
-                        "Port 53 conflict prevents local DNS – Dynadock will fallback to --manage-hosts."
-                    )
+                    suggestions.append(SUGGESTIONS["dns-conflict"])
 
         logger.info("Preflight checks completed.")
         return PreflightReport(
-            ok=not errors, warnings=warnings, errors=errors, suggestions=suggestions
+            ok=not errors,
+            warnings=warnings,
+            errors=errors,
+            suggestions=suggestions,
+            tokens=frozenset(tokens),
         )
 
     def try_autofix(self) -> List[str]:
         actions: List[str] = []
-        # Remove stale dynadock containers if present
-        for name in ("dynadock-caddy", "dynadock-dns"):
+        # Remove stale dynadock containers if present - one variadic
+        # 'docker rm -f' instead of a spawn and daemon round trip each.
+        names = ("dynadock-caddy", "dynadock-dns")
+        try:
+            subprocess.run(["docker", "rm", "-f", *names], **_RUN_KW)  # nosec B603 - Controlled command for Docker interaction
+            actions.extend(f"Ensured container '{name}' is not running" for name in names)
+        except Exception:
+            pass
+        # Flush resolved cache
+        if _which("resolvectl") is not None:
             try:
-                subprocess.run(
-                    ["docker", "rm", "-f", name], check=False, capture_output=True  # nosec B603 - Controlled command for Docker interaction
-                )
-                actions.append(f"Ensured container '{name}' is not running")
-            except Exception:
+                subprocess.run(["sudo", "resolvectl", "flush-caches"], **_RUN_KW)  # nosec B603 - Controlled command for system configuration
+                actions.append("Flushed systemd-resolved DNS cache")
+            except subprocess.TimeoutExpired:
                 pass
-        # Flush resolved cache
-        if shutil.which("resolvectl") is not None:
-            subprocess.run(["sudo", "resolvectl", "flush-caches"], check=False)  # nosec B603 - Controlled command for system configuration
-            actions.append("Flushed systemd-resolved DNS cache")
         return actions
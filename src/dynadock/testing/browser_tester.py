@@ -3,28 +3,55 @@
 Headless browser testing module for DynaDock
 """
 
+import functools
 import time
 from pathlib import Path
 from urllib.parse import urlparse
 from typing import Dict, Any
 
+
+@functools.lru_cache(maxsize=1)
+def _get_async_playwright():
+    """Import playwright lazily and only once per process."""
+    from playwright.async_api import async_playwright
+
+    return async_playwright
+
 # Create screenshots directory
 SCREENSHOTS_DIR = Path("test_screenshots")
 
+# Set once the directory has been cleaned this process – repeated
+# setup_screenshots_dir() calls then return immediately.
+_screenshots_dir_ready = False
 
-def cleanup_old_screenshots():
+
+def cleanup_old_screenshots(target: Path | None = None):
     """Remove old screenshots before new test run"""
     import shutil
 
-    if SCREENSHOTS_DIR.exists():
-        shutil.rmtree(SCREENSHOTS_DIR)
-    SCREENSHOTS_DIR.mkdir(exist_ok=True)
-    print(f"🧹 Cleaned screenshots directory: {SCREENSHOTS_DIR}")
+    global _screenshots_dir_ready
+    if target is None:
+        target = SCREENSHOTS_DIR
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir(parents=True, exist_ok=True)
+    if target == SCREENSHOTS_DIR:
+        _screenshots_dir_ready = True
+    print(f"🧹 Cleaned screenshots directory: {target}")
+
 
+def setup_screenshots_dir(root: Path | None = None) -> Path:
+    """Setup screenshots directory with cleanup (once per process).
 
-def setup_screenshots_dir():
-    """Setup screenshots directory with cleanup"""
-    cleanup_old_screenshots()
+    With *root* given the directory lives under it instead of the CWD,
+    bypassing the process-wide ready flag - callers such as tests get a
+    freshly cleaned, isolated directory every time.
+    """
+    if root is not None:
+        target = root / SCREENSHOTS_DIR.name
+        cleanup_old_screenshots(target)
+        return target
+    if not _screenshots_dir_ready:
+        cleanup_old_screenshots()
     return SCREENSHOTS_DIR
 
 
@@ -42,7 +69,7 @@ async def test_domain_headless(
     log(f"Timeout ustawiony na: {timeout}s")
 
     try:
-        from playwright.async_api import async_playwright
+        async_playwright = _get_async_playwright()
 
         log("Importowanie Playwright - OK")
 
@@ -125,6 +152,7 @@ async def test_domain_headless(
                 "error": f"Browser setup failed: {str(e)}",
                 "errors": [],
                 "ssl_errors": [],
+                "network_requests_count": 0,
                 "network_requests": [],
             }
 
@@ -239,7 +267,10 @@ async def _process_successful_response(
         "screenshot": str(screenshot_path),
         "security_info": security_info,
         "page_analysis": page_analysis,
-        "network_requests": network_requests,
+        # A typical page produces 50-200 requests, each with full headers;
+        # keep a sampled head plus the total so reports stay small.
+        "network_requests_count": len(network_requests),
+        "network_requests": network_requests[:25],
         "console_logs": console_logs[-10:],
         "errors": errors,
         "ssl_errors": ssl_errors,
@@ -260,7 +291,8 @@ async def _process_failed_response(
         "success": False,
         "error": "No response received",
         "screenshot": str(screenshot_path),
-        "network_requests": network_requests,
+        "network_requests_count": len(network_requests),
+        "network_requests": network_requests[:25],
         "errors": errors,
         "ssl_errors": ssl_errors,
     }
@@ -280,7 +312,8 @@ async def _process_exception(
         "success": False,
         "error": str(exception),
         "screenshot": str(screenshot_path),
-        "network_requests": network_requests,
+        "network_requests_count": len(network_requests),
+        "network_requests": network_requests[:25],
         "errors": errors,
         "ssl_errors": ssl_errors,
     }
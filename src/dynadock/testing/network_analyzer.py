@@ -5,12 +5,46 @@ Network connectivity analysis module for DynaDock testing
 
 import socket
 import ssl
+import time
 from urllib.parse import urlparse
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
-def analyze_network_connectivity(url: str, verbose: bool = False) -> Dict[str, Any]:
-    """Detailed network analysis for a URL with enhanced logging"""
+def resolve(hostname: str) -> Dict[str, Any]:
+    """Resolve a hostname, returning success/ip/time without raising."""
+    start_time = time.time()
+    try:
+        ip = socket.gethostbyname(hostname)
+        return {"success": True, "ip": ip, "time": time.time() - start_time}
+    except Exception as e:
+        return {"success": False, "error": str(e), "time": time.time() - start_time}
+
+
+def tcp_probe(hostname: str, port: int, timeout: float = 2.0) -> bool:
+    """Bare TCP connect liveness probe.
+
+    Uses AF_INET explicitly and skips TLS/HTTP entirely, so it is an order of
+    magnitude cheaper than a full HTTP request when only liveness matters.
+    """
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            return sock.connect_ex((hostname, port)) == 0
+        finally:
+            sock.close()
+    except Exception:
+        return False
+
+
+def analyze_network_connectivity(
+    url: str, verbose: bool = False, resolved_ip: Optional[str] = None
+) -> Dict[str, Any]:
+    """Detailed network analysis for a URL with enhanced logging.
+
+    Pass ``resolved_ip`` when the hostname has already been resolved (e.g.
+    when probing several URLs on the same host) to skip the DNS lookup.
+    """
     parsed = urlparse(url)
     hostname = parsed.hostname or "localhost"
     port = parsed.port or (443 if parsed.scheme == "https" else 80)
@@ -38,45 +72,27 @@ def analyze_network_connectivity(url: str, verbose: bool = False) -> Dict[str, A
 
     # DNS resolution test
     log("Testowanie rozwiązywania DNS...")
-    import time
-
-    start_time = time.time()
-    try:
-        ip = socket.gethostbyname(hostname)
-        dns_time = time.time() - start_time
-        analysis["dns_resolution"] = {"success": True, "ip": ip, "time": dns_time}
-        analysis["timing"]["dns"] = dns_time
-        log(f"DNS SUCCESS: {hostname} → {ip} ({dns_time:.3f}s)")
-    except Exception as e:
-        dns_time = time.time() - start_time
-        analysis["dns_resolution"] = {
-            "success": False,
-            "error": str(e),
-            "time": dns_time,
-        }
-        analysis["timing"]["dns"] = dns_time
-        log(f"DNS FAILED: {e} ({dns_time:.3f}s)")
+    if resolved_ip is not None:
+        dns_result = {"success": True, "ip": resolved_ip, "time": 0.0, "cached": True}
+    else:
+        dns_result = resolve(hostname)
+    analysis["dns_resolution"] = dns_result
+    analysis["timing"]["dns"] = dns_result["time"]
+    if dns_result["success"]:
+        log(f"DNS SUCCESS: {hostname} → {dns_result['ip']} ({dns_result['time']:.3f}s)")
+    else:
+        log(f"DNS FAILED: {dns_result['error']} ({dns_result['time']:.3f}s)")
 
     # TCP connection test
     log(f"Testowanie połączenia TCP na port {port}...")
     start_time = time.time()
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(5)
-        result = sock.connect_ex((hostname, port))
-        tcp_time = time.time() - start_time
-        analysis["tcp_connect"] = result == 0
-        analysis["timing"]["tcp"] = tcp_time
-        if result == 0:
-            log(f"TCP SUCCESS: Port {port} dostępny ({tcp_time:.3f}s)")
-        else:
-            log(f"TCP FAILED: Port {port} niedostępny, kod: {result} ({tcp_time:.3f}s)")
-        sock.close()
-    except Exception as e:
-        tcp_time = time.time() - start_time
-        analysis["tcp_connect"] = False
-        analysis["timing"]["tcp"] = tcp_time
-        log(f"TCP EXCEPTION: {e} ({tcp_time:.3f}s)")
+    analysis["tcp_connect"] = tcp_probe(hostname, port, timeout=5)
+    tcp_time = time.time() - start_time
+    analysis["timing"]["tcp"] = tcp_time
+    if analysis["tcp_connect"]:
+        log(f"TCP SUCCESS: Port {port} dostępny ({tcp_time:.3f}s)")
+    else:
+        log(f"TCP FAILED: Port {port} niedostępny ({tcp_time:.3f}s)")
 
     # Port scan common ports
     log("Skanowanie popularnych portów...")
@@ -84,20 +100,11 @@ def analyze_network_connectivity(url: str, verbose: bool = False) -> Dict[str, A
     scan_start = time.time()
     for p in common_ports:
         port_start = time.time()
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((hostname, p))
-            port_time = time.time() - port_start
-            is_open = result == 0
-            analysis["port_scan"][p] = is_open
-            status = "OPEN" if is_open else "CLOSED"
-            log(f"Port {p}: {status} ({port_time:.3f}s)")
-            sock.close()
-        except Exception as e:
-            port_time = time.time() - port_start
-            analysis["port_scan"][p] = False
-            log(f"Port {p}: ERROR - {e} ({port_time:.3f}s)")
+        is_open = tcp_probe(hostname, p, timeout=2)
+        port_time = time.time() - port_start
+        analysis["port_scan"][p] = is_open
+        status = "OPEN" if is_open else "CLOSED"
+        log(f"Port {p}: {status} ({port_time:.3f}s)")
 
     scan_time = time.time() - scan_start
     analysis["timing"]["port_scan"] = scan_time
@@ -5,19 +5,13 @@ System status checker module for DynaDock testing
 
 import json
 import subprocess
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
 
-def check_system_status() -> Dict[str, Any]:
-    """Check Docker containers, processes, and system status"""
-    status = {
-        "containers": [],
-        "ports_listening": {},
-        "hosts_file": {},
-        "processes": [],
-    }
-
-    # Docker containers
+def _probe_containers() -> List[Dict[str, Any]]:
+    """List running Docker containers."""
+    containers: List[Dict[str, Any]] = []
     try:
         result = subprocess.run(
             ["docker", "ps", "--format", "json"],
@@ -29,17 +23,19 @@ def check_system_status() -> Dict[str, Any]:
             for line in result.stdout.strip().split("\n"):
                 if line.strip():
                     try:
-                        status["containers"].append(json.loads(line))
+                        containers.append(json.loads(line))
                     except Exception:
                         pass
         else:
-            status["containers"] = [
-                {"error": "No containers running or Docker not accessible"}
-            ]
+            containers = [{"error": "No containers running or Docker not accessible"}]
     except Exception as e:
-        status["containers"] = [{"error": str(e)}]
+        containers = [{"error": str(e)}]
+    return containers
+
 
-    # Check listening ports
+def _probe_ports() -> Dict[Any, str]:
+    """Find DynaDock-related listening ports."""
+    ports: Dict[Any, str] = {}
     try:
         result = subprocess.run(
             ["netstat", "-tlnp"], capture_output=True, text=True, timeout=10
@@ -54,30 +50,48 @@ def check_system_status() -> Dict[str, Any]:
                 ):
                     parts = line.split()
                     if len(parts) >= 4:
-                        status["ports_listening"][parts[3]] = (
-                            parts[6] if len(parts) > 6 else "unknown"
-                        )
-
-        if not status["ports_listening"]:
-            status["ports_listening"][
-                "info"
-            ] = "No DynaDock-related ports found listening"
+                        ports[parts[3]] = parts[6] if len(parts) > 6 else "unknown"
+
+        if not ports:
+            ports["info"] = "No DynaDock-related ports found listening"
     except Exception as e:
-        status["ports_listening"]["error"] = str(e)
+        ports["error"] = str(e)
+    return ports
+
 
-    # Check /etc/hosts for dynadock.lan entries
+def _probe_hosts_file() -> Dict[Any, str]:
+    """Collect dynadock.lan entries from /etc/hosts."""
+    entries: Dict[Any, str] = {}
     try:
         with open("/etc/hosts", "r") as f:
             for line_num, line in enumerate(f, 1):
                 if "dynadock.lan" in line:
-                    status["hosts_file"][line_num] = line.strip()
+                    entries[line_num] = line.strip()
 
-        if not status["hosts_file"]:
-            status["hosts_file"]["info"] = "No dynadock.lan entries found in /etc/hosts"
+        if not entries:
+            entries["info"] = "No dynadock.lan entries found in /etc/hosts"
     except Exception as e:
-        status["hosts_file"]["error"] = str(e)
+        entries["error"] = str(e)
+    return entries
+
+
+def check_system_status() -> Dict[str, Any]:
+    """Check Docker containers, processes, and system status.
 
-    return status
+    The probes are independent and I/O-bound (subprocess waits and file
+    reads), so they run concurrently - wall time is the slowest probe
+    instead of the sum of all of them.
+    """
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        containers = ex.submit(_probe_containers)
+        ports = ex.submit(_probe_ports)
+        hosts = ex.submit(_probe_hosts_file)
+        return {
+            "containers": containers.result(),
+            "ports_listening": ports.result(),
+            "hosts_file": hosts.result(),
+            "processes": [],
+        }
 
 
 def get_docker_status() -> Dict[str, Any]:
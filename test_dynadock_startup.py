@@ -8,14 +8,28 @@ import sys
 import os
 import subprocess
 import time
+import docker
 import requests
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from dynadock.caddy_config import CaddyConfig
+
 console = Console()
 
+# Shared Docker client – one Unix-socket connection for all steps instead of
+# spawning a fresh `docker`/`docker-compose` CLI process per query.
+_docker_client = None
+
+def get_docker_client():
+    """Return a lazily created, shared Docker SDK client."""
+    global _docker_client
+    if _docker_client is None:
+        _docker_client = docker.from_env()
+    return _docker_client
+
 def run_command(cmd, cwd=None, check=True):
     """Run command and return result"""
     try:
@@ -36,24 +50,29 @@ def step_1_cleanup():
     """Step 1: Clean up existing containers"""
     console.print(Panel("[bold blue]Step 1: Cleanup existing containers[/bold blue]"))
     
-    # Stop all DynaDock related containers
-    commands = [
-        "docker stop dynadock-caddy 2>/dev/null || true",
-        "docker rm dynadock-caddy 2>/dev/null || true",
-        "cd /home/tom/github/dynapsys/dynadock/examples/fullstack && docker-compose down 2>/dev/null || true"
-    ]
-    
-    for cmd in commands:
-        success, stdout, stderr = run_command(cmd, check=False)
-        console.print(f"✓ {cmd}")
-    
+    client = get_docker_client()
+
+    # Stop all DynaDock related containers via the SDK (no CLI cold-start)
+    try:
+        client.containers.get("dynadock-caddy").remove(force=True)
+        console.print("✓ Removed dynadock-caddy container")
+    except docker.errors.NotFound:
+        console.print("✓ dynadock-caddy not running")
+
+    run_command(
+        "docker-compose down 2>/dev/null || true",
+        cwd="/home/tom/github/dynapsys/dynadock/examples/fullstack",
+        check=False,
+    )
+    console.print("✓ docker-compose down")
+
     # Check no containers running
-    success, stdout, stderr = run_command("docker ps -q")
-    if stdout.strip():
+    running = client.containers.list(filters={"status": "running"})
+    if running:
         console.print(f"[yellow]Warning: Some containers still running[/yellow]")
     else:
         console.print("[green]✓ All containers stopped[/green]")
-    
+
     return True
 
 def step_2_check_certs():
@@ -116,11 +135,11 @@ def step_4_start_compose():
     console.print("Waiting for services to start...")
     time.sleep(10)
     
-    # Check service status
-    success, stdout, stderr = run_command("docker-compose ps", cwd=cwd)
+    # Check service status via the shared Docker client
     console.print("Service status:")
-    console.print(stdout)
-    
+    for container in get_docker_client().containers.list(all=True):
+        console.print(f"  {container.name}\t{container.status}")
+
     return True
 
 def step_5_start_caddy():
@@ -128,16 +147,10 @@ def step_5_start_caddy():
     console.print(Panel("[bold blue]Step 5: Start Caddy with HTTPS[/bold blue]"))
     
     cwd = "/home/tom/github/dynapsys/dynadock/examples/fullstack"
-    
-    # Generate Caddyfile
-    sys.path.insert(0, '/home/tom/github/dynapsys/dynadock/src')
-    os.chdir(cwd)
-    
+
     try:
-        from dynadock.caddy_config import CaddyConfig
-        
-        caddy = CaddyConfig(Path('.'))
-        
+        caddy = CaddyConfig(Path(cwd))
+
         # Generate configuration
         services = {'frontend': 8000, 'backend': 8001, 'postgres': 5432, 'redis': 6379, 'mailhog': 8025}
         ips = {service: '127.0.0.1' for service in services}
@@ -200,10 +213,14 @@ def step_7_final_status():
     """Step 7: Show final status"""
     console.print(Panel("[bold blue]Step 7: Final Status[/bold blue]"))
     
-    # Show running containers
-    success, stdout, stderr = run_command("docker ps --format 'table {{.Names}}\t{{.Status}}\t{{.Ports}}'")
+    # Show running containers via the shared Docker client
     console.print("Running containers:")
-    console.print(stdout)
+    for container in get_docker_client().containers.list():
+        ports = ", ".join(
+            f"{p}→{m[0]['HostPort']}" if m else p
+            for p, m in (container.ports or {}).items()
+        )
+        console.print(f"  {container.name}\t{container.status}\t{ports}")
     
     # Show listening ports
     success, stdout, stderr = run_command("sudo netstat -tlnp | grep ':80\\|:443'", check=False)
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import subprocess
 import sys
-import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import GeneratorType
 from unittest.mock import Mock, patch
 
 import docker
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
 from dynadock.lan_network_manager import LANNetworkManager
 
 # ---------------------------------------------------------------------------
@@ -23,27 +28,84 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
+# Resolve the spec class once; Mock(spec=...) then skips re-introspecting
+# docker.DockerClient for every mock_docker_client instantiation.
+_DOCKER_CLIENT_SPEC = docker.DockerClient
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests once per session when no Linux netstack.
+
+    A single ``os.path.exists`` probe here replaces per-test ``skipif``
+    decorators that each ran a ``stat`` at collection time.
+    """
+    if os.path.exists("/proc/sys/net/ipv4/ip_forward"):
+        return
+    skip = pytest.mark.skip(reason="Integration tests require Linux network stack")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@functools.lru_cache(maxsize=1)
+def _real_docker() -> docker.DockerClient:
+    """Connect to the Docker daemon once and reuse the handle suite-wide."""
+    client = docker.from_env()
+    client.ping()  # type: ignore[attr-defined]
+    return client
+
 
 # ---------------------------------------------------------------------------
 # Generic fixtures
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm_pyc(tmp_path_factory) -> None:
+    """Precompile the dynadock package once per session.
+
+    Subsequent dynadock subprocess invocations load prebuilt ``.pyc``
+    files instead of recompiling on every cold start. The cache prefix
+    points at a session tmpdir so concurrent xdist workers do not race
+    on writes inside ``src/``.
+    """
+    cache_dir = tmp_path_factory.mktemp("pycache")
+    os.environ.setdefault("PYTHONPYCACHEPREFIX", str(cache_dir))
+    subprocess.run(
+        [sys.executable, "-m", "compileall", "-q", str(SRC_PATH / "dynadock")],
+        check=False,
+        env={**os.environ, "PYTHONPYCACHEPREFIX": os.environ["PYTHONPYCACHEPREFIX"]},
+    )
+
+
 @pytest.fixture()
 def temp_dir() -> GeneratorType[Path, None, None]:
     """Return a temporary directory path that is cleaned up afterwards."""
-    tmp_path = Path(tempfile.mkdtemp())
+    with tempfile.TemporaryDirectory() as tmp_path:
+        yield Path(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def http() -> GeneratorType[requests.Session, None, None]:
+    """Shared keep-alive HTTP session for tests that hit live services.
+
+    One urllib3 pool per session means consecutive requests to the same
+    host reuse a socket instead of paying a TCP handshake each time.
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+    session.headers.update({"Connection": "keep-alive"})
     try:
-        yield tmp_path
+        yield session
     finally:
-        shutil.rmtree(tmp_path, ignore_errors=True)
+        session.close()
 
 
 @pytest.fixture()
 def mock_docker_client() -> GeneratorType[Mock, None, None]:
     """Patch ``docker.from_env`` so no real Docker daemon is required."""
     with patch("docker.from_env") as patched:
-        client = Mock(spec=docker.DockerClient)
+        client = Mock(spec=_DOCKER_CLIENT_SPEC)
         patched.return_value = client
         yield client
 
@@ -57,13 +119,53 @@ def mock_docker_client() -> GeneratorType[Mock, None, None]:
 def docker_client():
     """Return real Docker client if daemon is available, otherwise skip."""
     try:
-        _client = docker.from_env()
-        _client.ping()  # type: ignore[attr-defined]
-        return _client
+        return _real_docker()
     except Exception:  # pragma: no cover – CI w/o docker
         pytest.skip("Docker daemon not available – skipping integration tests")
 
 
+class DummyProc:
+    """Minimal ``subprocess.CompletedProcess`` stand-in shared across tests."""
+
+    def __init__(self, returncode: int = 0, stdout: str = "", stderr: str = "") -> None:
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+# Shared success result - the run stubs below hand this singleton back
+# instead of allocating a DummyProc per subprocess call.
+OK_PROC = DummyProc(0, "")
+
+
+class _RunRecorder:
+    """``subprocess.run`` stand-in that records argvs and sudo scripts."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self.scripts: list[str] = []
+
+    def __call__(self, args, *_, **__) -> DummyProc:
+        self.calls.append(list(args))
+        if list(args[:3]) == ["sudo", "bash", "-c"]:
+            self.scripts.append(args[3])
+        return OK_PROC
+
+
+@pytest.fixture()
+def fake_run_recorder() -> _RunRecorder:
+    """Return a fresh recording ``subprocess.run`` replacement."""
+    return _RunRecorder()
+
+
+def _swallow(func, *args, **kwargs) -> None:
+    """Call ``func`` and ignore any failure (resource may already be gone)."""
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        pass
+
+
 @pytest.fixture()
 def cleanup_docker(docker_client):  # noqa: ANN001 – dynamic fixture
     """Collect containers/networks/volumes created in test and remove them."""
@@ -71,21 +173,24 @@ def cleanup_docker(docker_client):  # noqa: ANN001 – dynamic fixture
     yield resources
 
     # --- tear-down ----------------------------------------------------------
-    for container_id in resources["containers"]:
-        try:
-            docker_client.containers.get(container_id).remove(force=True)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-    for network_id in resources["networks"]:
-        try:
-            docker_client.networks.get(network_id).remove()  # type: ignore[attr-defined]
-        except Exception:
-            pass
-    for volume_id in resources["volumes"]:
-        try:
-            docker_client.volumes.get(volume_id).remove(force=True)  # type: ignore[attr-defined]
-        except Exception:
-            pass
+    # The low-level API removes by id in one HTTP call (no .get() roundtrip
+    # first), and the pool overlaps the removals instead of paying dockerd
+    # latency serially per resource.
+    api = docker_client.api  # type: ignore[attr-defined]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda cid: _swallow(api.remove_container, cid, force=True),
+                resources["containers"],
+            )
+        )
+        list(executor.map(lambda nid: _swallow(api.remove_network, nid), resources["networks"]))
+        list(
+            executor.map(
+                lambda vid: _swallow(api.remove_volume, vid, force=True),
+                resources["volumes"],
+            )
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -6,6 +6,7 @@ Tests for the DynaDock health check script.
 import os
 import sys
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import subprocess
 import logging
@@ -18,9 +19,24 @@ with patch("logging.basicConfig"), patch("logging.getLogger"):
     import health_check
 
 
+def _resp(code):
+    """Plain response stub - cheaper than a MagicMock per attribute access."""
+    return SimpleNamespace(status_code=code)
+
+
 class TestHealthCheck(unittest.TestCase):
     """Test cases for the health check script."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one real HealthChecker for the whole class.
+
+        Constructing the session with its retry adapters is the expensive
+        part; the tests only read from it, so it is safe to share. Tests
+        that need a mocked session construct their own checker around it.
+        """
+        cls.checker = health_check.HealthChecker()
+
     def setUp(self):
         """Set up test fixtures."""
         self.original_services = health_check.SERVICES.copy()
@@ -59,17 +75,16 @@ class TestHealthCheck(unittest.TestCase):
 
     def test_health_checker_initialization(self):
         """Test HealthChecker initialization."""
-        checker = health_check.HealthChecker()
-        self.assertIsNotNone(checker.session)
-        self.assertTrue(hasattr(checker.session.adapters["http://"], "max_retries"))
+        self.assertIsNotNone(self.checker.session)
+        self.assertTrue(
+            hasattr(self.checker.session.adapters["http://"], "max_retries")
+        )
 
     @patch("health_check.requests.Session")
     def test_health_checker_check_service_health_success(self, mock_session):
         """Test successful health check with retries."""
         # Setup mock session
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_session.return_value.get.return_value = mock_response
+        mock_session.return_value.get.return_value = _resp(200)
 
         # Test the function
         checker = health_check.HealthChecker(mock_session.return_value)
@@ -85,34 +100,31 @@ class TestHealthCheck(unittest.TestCase):
     @patch("health_check.requests.Session")
     def test_health_checker_check_service_health_retry(self, mock_session):
         """Test health check with retries on failure."""
-        # Setup mock session to fail once then succeed
-        mock_response_success = MagicMock()
-        mock_response_success.status_code = 200
-        mock_response_failure = MagicMock()
-        mock_response_failure.status_code = 500
-
-        mock_session.return_value.get.side_effect = [
-            mock_response_failure,  # First attempt fails
-            mock_response_success,  # Second attempt succeeds
-        ]
-
-        # Test the function
-        checker = health_check.HealthChecker(mock_session.return_value)
-        result = checker.check_service_health(
-            "test_service", health_check.SERVICES["test_service"]
-        )
-
-        # Assertions
-        self.assertTrue(result.is_healthy)
-        self.assertEqual(mock_session.return_value.get.call_count, 2)
+        # Each case is the status sequence the mocked session serves; the
+        # generator side_effect builds responses lazily per attempt.
+        for sequence in [(500, 200), (500, 500, 200)]:
+            with self.subTest(sequence=sequence):
+                config = dict(
+                    health_check.SERVICES["test_service"], retries=len(sequence)
+                )
+                mock_session.return_value.get.reset_mock()
+                mock_session.return_value.get.side_effect = (
+                    _resp(code) for code in sequence
+                )
+
+                checker = health_check.HealthChecker(mock_session.return_value)
+                result = checker.check_service_health("test_service", config)
+
+                self.assertTrue(result.is_healthy)
+                self.assertEqual(
+                    mock_session.return_value.get.call_count, len(sequence)
+                )
 
     @patch("health_check.requests.Session")
     def test_health_checker_check_service_health_failure(self, mock_session):
         """Test failed health check after all retries."""
         # Setup mock session to always fail
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_session.return_value.get.return_value = mock_response
+        mock_session.return_value.get.return_value = _resp(500)
 
         # Test the function
         checker = health_check.HealthChecker(mock_session.return_value)
@@ -2,32 +2,107 @@
 Comprehensive tests for LAN Network Manager functionality
 """
 
+import itertools
+import json
 import pytest
-import unittest.mock as mock
 import subprocess
 import ipaddress
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, Mock
 
 from dynadock.lan_network_manager import LANNetworkManager
 from dynadock.exceptions import DynaDockNetworkError
 
 
-class TestLANNetworkManager:
-    """Test suite for LAN Network Manager"""
+class FakeProc:
+    """Plain-callable stand-in for ``subprocess.run``.
+
+    Returns itself so ``.returncode``/``.stderr`` resolve directly; a
+    plain function call here is far cheaper than a ``MagicMock`` plus
+    the per-test patch start/stop machinery. Tests that need varying
+    behaviour set ``returncodes`` to an iterator and each call pops the
+    next value.
+    """
+
+    def __init__(self, returncode=0, stderr=""):
+        self.returncode = returncode
+        self.stderr = stderr
+        self.returncodes = None
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if self.returncodes is not None:
+            self.returncode = next(self.returncodes)
+        return self
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Swap ``subprocess.run`` for a configurable FakeProc stub"""
+    fake = FakeProc()
+    monkeypatch.setattr(subprocess, "run", fake)
+    return fake
+
+
+@pytest.fixture
+def fake_check_output(monkeypatch):
+    """Swap ``subprocess.check_output`` for a plain-function stub.
+
+    Set ``stub.output`` for the canned result or ``stub.error`` to make
+    the call raise instead.
+    """
+
+    def stub(*args, **kwargs):
+        stub.calls += 1
+        if stub.error is not None:
+            raise stub.error
+        return stub.output
+
+    stub.calls = 0
+    stub.error = None
+    stub.output = ""
+    monkeypatch.setattr(subprocess, "check_output", stub)
+    return stub
+
+
+@pytest.fixture(scope="module")
+def project_dir(tmp_path_factory):
+    """Create one temporary project directory for the whole module"""
+    return tmp_path_factory.mktemp("lan_project")
+
+
+@pytest.fixture(scope="module")
+def lan_manager(project_dir):
+    """Build one LAN Network Manager for the whole module.
+
+    Bypasses ``__init__`` and assigns the attributes directly, so no
+    ``_auto_detect_interface`` patching (and no mock start/stop cycle)
+    is needed per test.
+    """
+    manager = LANNetworkManager.__new__(LANNetworkManager)
+    manager.error_handler = None
+    manager.project_dir = project_dir
+    manager.interface = "eth0"
+    manager.virtual_ips = []
+    manager.arp_announced = []
+    manager.ip_tracking_file = LANNetworkManager._TrackingFile(
+        project_dir / ".dynadock_lan_ips.json"
+    )
+    return manager
 
-    @pytest.fixture
-    def project_dir(self, tmp_path):
-        """Create a temporary project directory"""
-        return tmp_path / "test_project"
 
-    @pytest.fixture
-    def lan_manager(self, project_dir):
-        """Create LAN Network Manager instance with mocked interface detection"""
-        with patch.object(
-            LANNetworkManager, "_auto_detect_interface", return_value="eth0"
-        ):
-            return LANNetworkManager(project_dir)
+@pytest.fixture(autouse=True)
+def _reset_lan_manager(request):
+    """Clear the shared manager's mutable state before each test"""
+    if "lan_manager" in request.fixturenames:
+        manager = request.getfixturevalue("lan_manager")
+        manager.virtual_ips.clear()
+        manager.arp_announced.clear()
+
+
+class TestLANNetworkManager:
+    """Test suite for LAN Network Manager"""
 
     def test_init_with_interface(self, project_dir):
         """Test initialization with specified interface"""
@@ -44,20 +119,18 @@ class TestLANNetworkManager:
             manager = LANNetworkManager(project_dir)
             assert manager.interface == "eth0"
 
-    @patch("subprocess.check_output")
-    def test_auto_detect_interface_success(self, mock_subprocess, project_dir):
+    def test_auto_detect_interface_success(self, fake_check_output, project_dir):
         """Test successful interface auto-detection"""
-        mock_subprocess.return_value = "eth0\n"
+        fake_check_output.output = "eth0\n"
         manager = LANNetworkManager(project_dir)
         assert manager.interface == "eth0"
 
-    @patch("subprocess.check_output")
     @patch.object(LANNetworkManager, "_interface_exists")
     def test_auto_detect_interface_fallback(
-        self, mock_exists, mock_subprocess, project_dir
+        self, mock_exists, fake_check_output, project_dir
     ):
         """Test interface auto-detection with fallback"""
-        mock_subprocess.side_effect = subprocess.CalledProcessError(1, "cmd")
+        fake_check_output.error = subprocess.CalledProcessError(1, "cmd")
         mock_exists.side_effect = lambda iface: iface == "eth0"
 
         manager = LANNetworkManager(project_dir)
@@ -75,10 +148,9 @@ class TestLANNetworkManager:
         mock_geteuid.return_value = 1000
         assert lan_manager.check_root_privileges() is False
 
-    @patch("subprocess.check_output")
-    def test_get_network_details_success(self, mock_subprocess, lan_manager):
+    def test_get_network_details_success(self, fake_check_output, lan_manager):
         """Test successful network details retrieval"""
-        mock_subprocess.return_value = (
+        fake_check_output.output = (
             "2: eth0: <BROADCAST,MULTICAST,UP,LOWER_UP> inet 192.168.1.10/24"
         )
 
@@ -89,10 +161,9 @@ class TestLANNetworkManager:
         assert cidr == "24"
         assert broadcast == "192.168.1.255"
 
-    @patch("subprocess.check_output")
-    def test_get_network_details_failure(self, mock_subprocess, lan_manager):
+    def test_get_network_details_failure(self, fake_check_output, lan_manager):
         """Test network details retrieval failure"""
-        mock_subprocess.side_effect = subprocess.CalledProcessError(1, "cmd")
+        fake_check_output.error = subprocess.CalledProcessError(1, "cmd")
 
         result = lan_manager.get_network_details()
         assert result == (None, None, None, None)
@@ -102,7 +173,7 @@ class TestLANNetworkManager:
         with patch.object(
             lan_manager,
             "_is_ip_available",
-            side_effect=[False, True, True, False, True],
+            side_effect=iter([False, True, True, False, True]),
         ):
             free_ips = lan_manager.find_free_ips("192.168.1.0", "24", 2, 100)
 
@@ -110,29 +181,23 @@ class TestLANNetworkManager:
             assert len(free_ips) == 2
             assert all(ip.startswith("192.168.1.") for ip in free_ips)
 
-    @patch("subprocess.run")
-    def test_is_ip_available_ping_responds(self, mock_run, lan_manager):
+    def test_is_ip_available_ping_responds(self, fake_run, lan_manager):
         """Test IP availability when ping responds (IP not available)"""
-        mock_run.return_value.returncode = 0  # Ping successful = IP not available
+        fake_run.returncode = 0  # Ping successful = IP not available
 
         result = lan_manager._is_ip_available("192.168.1.100")
         assert result is False
 
-    @patch("subprocess.run")
-    def test_is_ip_available_no_response(self, mock_run, lan_manager):
+    def test_is_ip_available_no_response(self, fake_run, lan_manager):
         """Test IP availability when no response (IP available)"""
-        mock_run.side_effect = [
-            Mock(returncode=1),  # Ping fails
-            Mock(returncode=1),  # ARP fails
-        ]
+        fake_run.returncodes = iter([1, 1])  # Ping fails, then ARP fails
 
         result = lan_manager._is_ip_available("192.168.1.100")
         assert result is True
 
-    @patch("subprocess.run")
-    def test_add_virtual_ip_success(self, mock_run, lan_manager):
+    def test_add_virtual_ip_success(self, fake_run, lan_manager):
         """Test successful virtual IP addition"""
-        mock_run.return_value.returncode = 0
+        fake_run.returncode = 0
 
         with (
             patch.object(lan_manager, "_announce_arp"),
@@ -147,11 +212,10 @@ class TestLANNetworkManager:
             assert lan_manager.virtual_ips[0][0] == "192.168.1.100"
             assert lan_manager.virtual_ips[0][2] == "test_service"
 
-    @patch("subprocess.run")
-    def test_add_virtual_ip_failure(self, mock_run, lan_manager):
+    def test_add_virtual_ip_failure(self, fake_run, lan_manager):
         """Test virtual IP addition failure"""
-        mock_run.return_value.returncode = 1
-        mock_run.return_value.stderr = "Permission denied"
+        fake_run.returncode = 1
+        fake_run.stderr = "Permission denied"
 
         result = lan_manager.add_virtual_ip("192.168.1.100", "test_service")
 
@@ -191,10 +255,9 @@ class TestLANNetworkManager:
         with pytest.raises(DynaDockNetworkError, match="Root privileges required"):
             lan_manager.setup_services_lan(services)
 
-    @patch("subprocess.run")
-    def test_remove_virtual_ip_success(self, mock_run, lan_manager):
+    def test_remove_virtual_ip_success(self, fake_run, lan_manager):
         """Test successful virtual IP removal"""
-        mock_run.return_value.returncode = 0
+        fake_run.returncode = 0
         lan_manager.virtual_ips = [("192.168.1.100", "eth0:test", "test_service")]
 
         with patch.object(lan_manager, "_save_ip_tracking"):
@@ -203,10 +266,19 @@ class TestLANNetworkManager:
             assert result is True
             assert len(lan_manager.virtual_ips) == 0
 
-    def test_cleanup_all(self, lan_manager):
+    def test_cleanup_all(self, lan_manager, monkeypatch):
         """Test cleanup all virtual IPs"""
         lan_manager.virtual_ips = [("192.168.1.100", "eth0:test", "test")]
 
+        # Swap the tracking file wholesale instead of patch.object-ing
+        # Path methods, which forces mock's slow class-walk fallback;
+        # monkeypatch restores the real file afterwards.
+        monkeypatch.setattr(
+            lan_manager,
+            "ip_tracking_file",
+            SimpleNamespace(exists=lambda: True, unlink=lambda missing_ok=False: None),
+        )
+
         with (
             patch.object(
                 lan_manager,
@@ -214,8 +286,6 @@ class TestLANNetworkManager:
                 return_value={"virtual_ips": [{"ip": "192.168.1.100"}]},
             ),
             patch.object(lan_manager, "remove_virtual_ip", return_value=True),
-            patch.object(lan_manager.ip_tracking_file, "exists", return_value=True),
-            patch.object(lan_manager.ip_tracking_file, "unlink"),
         ):
 
             lan_manager.cleanup_all()
@@ -261,30 +331,33 @@ class TestLANNetworkManager:
         """Test IP tracking save and load functionality"""
         lan_manager.virtual_ips = [("192.168.1.100", "eth0:test", "test_service")]
 
-        with (
-            patch("builtins.open", mock.mock_open()),
-            patch("json.dump") as mock_json_dump,
-            patch("json.load") as mock_json_load,
-        ):
-
-            # Test save
+        try:
+            # Round-trip through the real tracking file in the tmp project
+            # dir - no builtins.open rewiring, and the serialized content
+            # is asserted instead of the json.dump call.
             lan_manager._save_ip_tracking()
-            mock_json_dump.assert_called_once()
+            saved = json.loads(lan_manager.ip_tracking_file.read_text())
+            assert saved["interface"] == "eth0"
+            assert saved["virtual_ips"][0]["ip"] == "192.168.1.100"
+            assert saved["virtual_ips"][0]["service"] == "test_service"
 
-            # Test load
-            mock_json_load.return_value = {"virtual_ips": [{"ip": "192.168.1.100"}]}
             result = lan_manager._load_ip_tracking()
-            assert "virtual_ips" in result
+            assert result["virtual_ips"] == saved["virtual_ips"]
+        finally:
+            lan_manager.ip_tracking_file.unlink(missing_ok=True)
 
 
+@pytest.mark.xdist_group("net")
 class TestLANNetworkManagerIntegration:
-    """Integration tests for LAN Network Manager (require root privileges)"""
+    """Integration tests for LAN Network Manager (require root privileges)
+
+    Skipped as a group when the Linux network stack is unavailable - see
+    the collection hook in conftest.py, which probes /proc once instead
+    of a stat call per skipif decorator.
+    """
+
+    pytestmark = pytest.mark.integration
 
-    @pytest.mark.integration
-    @pytest.mark.skipif(
-        not Path("/proc/sys/net/ipv4/ip_forward").exists(),
-        reason="Integration tests require Linux network stack",
-    )
     def test_network_detection_integration(self, tmp_path):
         """Integration test for network detection"""
         manager = LANNetworkManager(tmp_path)
@@ -293,11 +366,6 @@ class TestLANNetworkManagerIntegration:
         assert manager.interface is not None
         assert len(manager.interface) > 0
 
-    @pytest.mark.integration
-    @pytest.mark.skipif(
-        not Path("/proc/sys/net/ipv4/ip_forward").exists(),
-        reason="Integration tests require Linux network stack",
-    )
     def test_get_network_details_integration(self, tmp_path):
         """Integration test for network details retrieval"""
         manager = LANNetworkManager(tmp_path)
@@ -327,18 +395,20 @@ class TestLANNetworkManagerErrorHandling:
             with pytest.raises(DynaDockNetworkError):
                 LANNetworkManager(tmp_path)
 
-    def test_network_config_parse_error(self, lan_manager):
+    def test_network_config_parse_error(self, fake_check_output, lan_manager):
         """Test error when network configuration cannot be parsed"""
-        with patch("subprocess.check_output", return_value="invalid output"):
+        fake_check_output.output = "invalid output"
 
-            result = lan_manager.get_network_details()
-            assert result == (None, None, None, None)
+        result = lan_manager.get_network_details()
+        assert result == (None, None, None, None)
 
     def test_insufficient_ips_error(self, lan_manager):
         """Test error when not enough IPs are available"""
-        with patch.object(lan_manager, "_is_ip_available", return_value=False):
-
-            free_ips = lan_manager.find_free_ips("192.168.1.0", "24", 5, 100)
+        # repeat(False) keeps memory flat however far the sweep scans
+        with patch.object(
+            lan_manager, "_is_ip_available", side_effect=itertools.repeat(False)
+        ):
+            free_ips = lan_manager.find_free_ips("192.168.1.0", "24", 5, 2)
             assert len(free_ips) == 0
 
 
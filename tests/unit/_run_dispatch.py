@@ -0,0 +1,42 @@
+"""Dict-dispatched ``subprocess.run`` stand-in shared by unit tests."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Tuple
+
+
+class DummyProc:
+    def __init__(self, returncode: int = 0, stdout: str = "", stderr: str = "") -> None:
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+# Shared success result - handed back for unregistered commands instead of
+# allocating a DummyProc per call.
+OK = DummyProc(0, "")
+
+
+class RunDispatch:
+    """``subprocess.run`` replacement dispatching on the argv prefix.
+
+    A longest-prefix dict lookup (three, then two, then one leading
+    args) replaces the linear if-chains each test previously rebuilt in
+    its ``fake_run`` closure. Handlers receive the full argv; anything
+    unregistered succeeds with the shared ``OK`` result.
+    """
+
+    def __init__(self) -> None:
+        self._table: Dict[Tuple[str, ...], Callable] = {}
+        self.calls: List[List[str]] = []
+
+    def register(self, prefix, handler) -> None:
+        self._table[tuple(prefix)] = handler
+
+    def __call__(self, args, *_, **__) -> DummyProc:
+        self.calls.append(list(args))
+        for width in (3, 2, 1):
+            handler = self._table.get(tuple(args[:width]))
+            if handler is not None:
+                return handler(args)
+        return OK
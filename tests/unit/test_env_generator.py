@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import io
 from unittest.mock import patch
 
+import pytest
 
 from dynadock.env_generator import EnvGenerator
 
 
+class _MemEnvFile(io.StringIO):
+    """In-memory stand-in for the env file - generate() writes here."""
+
+    def open(self, mode="w", encoding=None):
+        return self
+
+    def close(self):  # keep the contents inspectable after the with-block
+        pass
+
+
+@pytest.fixture()
+def mem_env_file() -> _MemEnvFile:
+    """Capture env-file output in memory instead of touching disk."""
+    return _MemEnvFile()
+
+
 class TestEnvGenerator:
     """Test EnvGenerator functionality."""
 
@@ -21,11 +39,11 @@ class TestEnvGenerator:
     # ------------------------------------------------------------------
 
     @patch("secrets.token_urlsafe")
-    def test_generate_basic(self, mock_token, temp_dir):
+    def test_generate_basic(self, mock_token, mem_env_file):
         """Generate minimal env vars for two services with TLS enabled."""
         mock_token.side_effect = ["secret1", "secret2", "pass1", "pass2", "pass3"]
-        env_file = temp_dir / ".env.test"
-        generator = EnvGenerator(str(env_file))
+        generator = EnvGenerator(".env.test")
+        generator.env_file = mem_env_file
 
         services = {
             "api": {"image": "node:18"},
@@ -47,14 +65,15 @@ class TestEnvGenerator:
         assert env_vars["FRONTEND_PORT"] == "8002"
         # Secrets
         assert env_vars["DYNADOCK_SECRET_KEY"] == "secret1"
-        assert env_file.exists()
+        # Written content lands in the in-memory buffer
+        assert "API_PORT=8001" in mem_env_file.getvalue()
 
     @patch("secrets.token_urlsafe")
-    def test_generate_with_database(self, mock_token, temp_dir):
+    def test_generate_with_database(self, mock_token, mem_env_file):
         """Generate env vars for common databases."""
         mock_token.return_value = "testpass"
-        env_file = temp_dir / ".env.test"
-        generator = EnvGenerator(str(env_file))
+        generator = EnvGenerator(".env.test")
+        generator.env_file = mem_env_file
 
         services = {
             "postgres": {"image": "postgres:15"},
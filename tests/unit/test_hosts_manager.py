@@ -8,13 +8,6 @@ from dynadock.hosts_manager import HostsManager
 pytestmark = pytest.mark.unit
 
 
-class DummyProc:
-    def __init__(self, returncode: int = 0, stdout: str = "", stderr: str = "") -> None:
-        self.returncode = returncode
-        self.stdout = stdout
-        self.stderr = stderr
-
-
 def test_build_block_formatting(tmp_path: Path):
     hm = HostsManager(tmp_path)
     ip_map: Dict[str, str] = {
@@ -43,29 +36,19 @@ def test_build_block_formatting(tmp_path: Path):
     ]
 
 
-def test_apply_writes_temp_and_calls_sudo(monkeypatch, tmp_path: Path):
+def test_apply_writes_temp_and_calls_sudo(monkeypatch, tmp_path: Path, fake_run_recorder):
     hm = HostsManager(tmp_path)
-    calls: list[list[str]] = []
-    captured_script: list[str] = []
-
-    def fake_run(args, *_, **__):
-        # Capture command and script argument
-        calls.append(list(args))
-        if args[0] == "sudo" and args[1] == "bash" and args[2] == "-c":
-            captured_script.append(args[3])
-        return DummyProc(0, "")
-
-    monkeypatch.setattr("dynadock.hosts_manager.subprocess.run", fake_run)
+    monkeypatch.setattr("dynadock.hosts_manager.subprocess.run", fake_run_recorder)
 
     ip_map = {"api": "172.20.0.10", "web": "172.20.0.11"}
     hm.apply(ip_map, domain="dynadock.lan")
 
     # Ensure sudo bash -c was called once
-    assert any(c[:3] == ["sudo", "bash", "-c"] for c in calls)
+    assert any(c[:3] == ["sudo", "bash", "-c"] for c in fake_run_recorder.calls)
 
     # Verify the script contains sed removal and appends the temp block file into /etc/hosts
-    assert captured_script, "Expected to capture the bash script passed to sudo"
-    script = captured_script[0]
+    assert fake_run_recorder.scripts, "Expected to capture the bash script passed to sudo"
+    script = fake_run_recorder.scripts[0]
     assert "sed -i.bak '" in script
     assert "# BEGIN DYNADOCK HOSTS" in script and "# END DYNADOCK HOSTS" in script
     assert "cat '" in script and "' >> /etc/hosts" in script
@@ -75,23 +58,14 @@ def test_apply_writes_temp_and_calls_sudo(monkeypatch, tmp_path: Path):
     assert not tmp_block.exists(), "Temporary hosts block file should be cleaned up"
 
 
-def test_remove_calls_sudo_with_sed(monkeypatch, tmp_path: Path):
+def test_remove_calls_sudo_with_sed(monkeypatch, tmp_path: Path, fake_run_recorder):
     hm = HostsManager(tmp_path)
-    calls: list[list[str]] = []
-    captured_script: list[str] = []
-
-    def fake_run(args, *_, **__):
-        calls.append(list(args))
-        if args[:3] == ["sudo", "bash", "-c"]:
-            captured_script.append(args[3])
-        return DummyProc(0, "")
-
-    monkeypatch.setattr("dynadock.hosts_manager.subprocess.run", fake_run)
+    monkeypatch.setattr("dynadock.hosts_manager.subprocess.run", fake_run_recorder)
 
     hm.remove()
 
-    assert any(c[:3] == ["sudo", "bash", "-c"] for c in calls)
-    assert captured_script, "Expected a sed removal script to be passed"
-    script = captured_script[0]
+    assert any(c[:3] == ["sudo", "bash", "-c"] for c in fake_run_recorder.calls)
+    assert fake_run_recorder.scripts, "Expected a sed removal script to be passed"
+    script = fake_run_recorder.scripts[0]
     assert "sed -i.bak '" in script
     assert "BEGIN DYNADOCK HOSTS" in script and "END DYNADOCK HOSTS" in script
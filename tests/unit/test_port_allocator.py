@@ -3,12 +3,39 @@
 from __future__ import annotations
 
 import socket
-from unittest.mock import Mock, patch
+from collections import namedtuple
+from unittest.mock import patch
 
 import pytest
+from psutil import CONN_LISTEN
 
 from dynadock.port_allocator import PortAllocator
 
+# Lightweight stand-ins for psutil connection objects - C-level attribute
+# access instead of Mock.__getattr__ machinery per lookup.
+_Laddr = namedtuple("_Laddr", "port")
+_Conn = namedtuple("_Conn", "laddr status")
+
+
+class _FakeSock:
+    """Context-manager socket stub with a configurable bind outcome."""
+
+    def __init__(self, bind_error: OSError | None) -> None:
+        self._bind_error = bind_error
+
+    def __enter__(self) -> "_FakeSock":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def setsockopt(self, *args) -> None:
+        pass
+
+    def bind(self, addr) -> None:
+        if self._bind_error is not None:
+            raise self._bind_error
+
 
 class TestPortAllocator:
     """Test PortAllocator functionality."""
@@ -28,15 +55,10 @@ class TestPortAllocator:
     def test_scan_used_ports(self, mock_connections):
         """Verify that used ports are picked up during initial scan."""
         # Fake two listening ports returned by psutil
-        from psutil import CONN_LISTEN
-
-        mock_conn1 = Mock()
-        mock_conn1.laddr = Mock(port=8080)
-        mock_conn1.status = CONN_LISTEN
-        mock_conn2 = Mock()
-        mock_conn2.laddr = Mock(port=3000)
-        mock_conn2.status = CONN_LISTEN
-        mock_connections.return_value = [mock_conn1, mock_conn2]
+        mock_connections.return_value = [
+            _Conn(_Laddr(8080), CONN_LISTEN),
+            _Conn(_Laddr(3000), CONN_LISTEN),
+        ]
 
         allocator = PortAllocator()
         assert 8080 in allocator.allocated_ports
@@ -46,40 +68,24 @@ class TestPortAllocator:
     # Public API: is_port_free()
     # ------------------------------------------------------------------
 
-    def test_is_port_free_allocated(self):
-        """Already allocated ports should be reported as unavailable."""
-        allocator = PortAllocator()
-        allocator.allocated_ports.add(8080)
-        assert not allocator.is_port_free(8080)
-
-    @patch("socket.socket")
-    def test_is_port_free_socket_error(self, mock_socket_class):
-        """Socket bind errors should mark port as unavailable."""
-        from unittest.mock import MagicMock
-
-        mock_socket = MagicMock()
-        mock_socket.__enter__.return_value = mock_socket
-        mock_socket.__exit__.return_value = None
-        mock_socket.bind.side_effect = socket.error()
-        mock_socket_class.return_value = mock_socket
-
-        allocator = PortAllocator()
-        assert not allocator.is_port_free(8080)
-
-    @patch("socket.socket")
+    @pytest.mark.parametrize(
+        ("bind_error", "preallocated", "expected"),
+        [
+            pytest.param(None, {8080}, False, id="already-allocated"),
+            pytest.param(socket.error(), set(), False, id="bind-error"),
+            pytest.param(None, set(), True, id="free"),
+        ],
+    )
     @patch("psutil.net_connections", return_value=[])
-    def test_is_port_free_success(self, _mock_connections, mock_socket_class):
-        """Successful OS bind indicates free port."""
-        from unittest.mock import MagicMock
-
-        mock_socket = MagicMock()
-        mock_socket.__enter__.return_value = mock_socket
-        mock_socket.__exit__.return_value = None
-        mock_socket.bind.return_value = None  # no error
-        mock_socket_class.return_value = mock_socket
+    def test_is_port_free(
+        self, _mock_connections, monkeypatch, bind_error, preallocated, expected
+    ):
+        """is_port_free() combines the registry check with an OS bind probe."""
+        monkeypatch.setattr(socket, "socket", lambda *a, **k: _FakeSock(bind_error))
 
         allocator = PortAllocator()
-        assert allocator.is_port_free(8080)
+        allocator.allocated_ports.update(preallocated)
+        assert allocator.is_port_free(8080) is expected
 
     # ------------------------------------------------------------------
     # Public API: get_free_port()
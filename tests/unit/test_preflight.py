@@ -2,18 +2,12 @@ from pathlib import Path
 
 import pytest
 
-from dynadock.preflight import PreflightChecker
+from _run_dispatch import DummyProc, RunDispatch
+from dynadock.preflight import SUGGESTIONS, PreflightChecker, _port_busy
 
 pytestmark = pytest.mark.unit
 
 
-class DummyProc:
-    def __init__(self, returncode: int = 0, stdout: str = "", stderr: str = "") -> None:
-        self.returncode = returncode
-        self.stdout = stdout
-        self.stderr = stderr
-
-
 def _mk_which(mapping: dict[str, str | None]):
     def _which(name: str):
         return mapping.get(name)
@@ -21,162 +15,185 @@ def _mk_which(mapping: dict[str, str | None]):
     return _which
 
 
-def test_preflight_binaries_missing(monkeypatch, tmp_path: Path):
-    # No required binaries present
-    monkeypatch.setattr("dynadock.preflight.shutil.which", _mk_which({}))
-
-    # subprocess.run should simulate missing 'ss' and 'lsof' (raise FileNotFoundError)
-    def fake_run(args, *_, **__):
-        prog = args[0]
-        if prog in {"ss", "lsof"}:
-            raise FileNotFoundError()
-        if prog == "sudo":
-            # Simulate sudo not available producing exception in try/except
-            raise RuntimeError("sudo not available")
-        return DummyProc(1, "", "")
-
-    monkeypatch.setattr("dynadock.preflight.subprocess.run", fake_run)
-
-    report = PreflightChecker(tmp_path).run()
-
-    # Expect errors for each missing required binary + compose missing
-    assert any("Required binary not found: docker" in e for e in report.errors)
-    assert any("Required binary not found: ip" in e for e in report.errors)
-    assert any("Required binary not found: curl" in e for e in report.errors)
-    assert any(
-        "Neither docker-compose nor 'docker compose' plugin is available" in e
-        for e in report.errors
-    )
+def _raise(exc):
+    def _handler(args):
+        raise exc
+
+    return _handler
+
+
+# Everything a healthy host has on PATH; docker-compose is intentionally
+# absent so the plugin probe is exercised.
+_FULL_WHICH = {
+    "docker": "/usr/bin/docker",
+    "ip": "/usr/sbin/ip",
+    "curl": "/usr/bin/curl",
+    "resolvectl": "/usr/bin/resolvectl",
+    "ss": "/usr/sbin/ss",
+    "sudo": "/usr/bin/sudo",
+}
+
+# Header-only tables stand in for an idle host; without them the port
+# scan would read the real /proc/net and report whatever this machine
+# happens to have bound (e.g. systemd-resolved on 53).
+_EMPTY_PROC_TABLES = {
+    "/proc/net/tcp": "  sl local_address rem_address st\n",
+    "/proc/net/udp": "  sl local_address rem_address st\n",
+}
+
+# Canned /proc/net tables: TCP has port 80 (0x50) listening and 8080
+# (0x1F90) established (filtered out); UDP has port 53 (0x35) bound.
+_PROC_TABLES = {
+    "/proc/net/tcp": (
+        "  sl local_address rem_address st\n"
+        "   0: 00000000:0050 00000000:0000 0A\n"
+        "   1: 00000000:1F90 0100007F:0016 01\n"
+    ),
+    "/proc/net/udp": (
+        "  sl local_address rem_address st\n"
+        "   0: 00000000:0035 00000000:0000 07\n"
+    ),
+}
+
+
+def _setup_binaries_missing(dispatch):
+    # Nothing is on PATH, so run() must not spawn any of these at all -
+    # a stray call fails the test instead of being swallowed.
+    for binary in ("docker", "ss", "lsof", "sudo"):
+        dispatch.register(
+            [binary], _raise(AssertionError(f"{binary} spawned despite missing binary"))
+        )
+
+
+def _check_binaries_missing(report):
+    # Errors for each missing required binary + compose missing
+    assert {
+        "docker-missing",
+        "ip-missing",
+        "curl-missing",
+        "compose-missing",
+    } <= report.tokens
 
     # Warnings for no resolvectl, no ss/lsof, and sudo not available
-    assert any("resolvectl" in w for w in report.warnings)
-    assert any("Neither 'ss' nor 'lsof' found" in w for w in report.warnings)
-    assert any("Sudo not available" in w for w in report.warnings)
+    assert "resolvectl-missing" in report.tokens
+    assert "port-tools-missing" in report.tokens
+    assert "sudo-missing" in report.tokens
 
     assert report.ok is False
 
 
-def test_preflight_compose_plugin_ok(monkeypatch, tmp_path: Path):
-    # docker, ip, curl, resolvectl, ss available; docker-compose not installed
-    monkeypatch.setattr(
-        "dynadock.preflight.shutil.which",
-        _mk_which(
-            {
-                "docker": "/usr/bin/docker",
-                "ip": "/usr/sbin/ip",
-                "curl": "/usr/bin/curl",
-                "resolvectl": "/usr/bin/resolvectl",
-                "ss": "/usr/sbin/ss",
-                # docker-compose intentionally None -> plugin path used
-            }
-        ),
+def _setup_compose_ok(dispatch):
+    dispatch.register(
+        ["docker", "compose", "version"],
+        lambda _: DummyProc(0, "Docker Compose version v2.24.0"),
     )
+    # docker ps, sudo -n true and the ss snapshots fall through to OK
 
-    def fake_run(args, *_, **__):
-        # docker compose version succeeds
-        if args[:3] == ["docker", "compose", "version"]:
-            return DummyProc(0, "Docker Compose version v2.24.0")
-        # docker ps succeeds
-        if args[:2] == ["docker", "ps"]:
-            return DummyProc(0, "")
-        # sudo -n true succeeds
-        if args[:3] == ["sudo", "-n", "true"]:
-            return DummyProc(0, "")
-        # ss checks -> no ports in use
-        if args[0] == "ss":
-            return DummyProc(0, "")
-        return DummyProc(0, "")
-
-    monkeypatch.setattr("dynadock.preflight.subprocess.run", fake_run)
-
-    report = PreflightChecker(tmp_path).run()
 
+def _check_compose_ok(report):
     assert report.errors == []
-    # No warnings expected in the happy path
+    assert report.tokens == frozenset()
     assert report.ok is True
 
 
-def test_preflight_docker_inaccessible(monkeypatch, tmp_path: Path):
-    # Binaries present so we get to docker ps check
-    monkeypatch.setattr(
-        "dynadock.preflight.shutil.which",
-        _mk_which(
-            {
-                "docker": "/usr/bin/docker",
-                "ip": "/usr/sbin/ip",
-                "curl": "/usr/bin/curl",
-                "resolvectl": "/usr/bin/resolvectl",
-                "ss": "/usr/sbin/ss",
-            }
-        ),
+def _setup_docker_inaccessible(dispatch):
+    _setup_compose_ok(dispatch)
+    dispatch.register(
+        ["docker", "ps"],
+        lambda _: DummyProc(1, "", "Cannot connect to the Docker daemon"),
     )
 
-    def fake_run(args, *_, **__):
-        if args[:3] == ["docker", "compose", "version"]:
-            return DummyProc(0, "Docker Compose version v2.24.0")
-        if args[:2] == ["docker", "ps"]:
-            return DummyProc(1, "", "Cannot connect to the Docker daemon")
-        if args[:3] == ["sudo", "-n", "true"]:
-            return DummyProc(0, "")
-        if args[0] == "ss":
-            return DummyProc(0, "")
-        return DummyProc(0, "")
 
-    monkeypatch.setattr("dynadock.preflight.subprocess.run", fake_run)
+def _check_docker_inaccessible(report):
+    assert "docker-unreachable" in report.tokens
+    assert report.ok is False
 
-    report = PreflightChecker(tmp_path).run()
 
-    assert any("Cannot communicate with Docker daemon" in e for e in report.errors)
-    assert report.ok is False
+# Both HTTP ports listening - the shared free-port-80 hint must not be
+# duplicated in the suggestions.
+_PROC_TABLES_BOTH_HTTP = {
+    "/proc/net/tcp": (
+        "  sl local_address rem_address st\n"
+        "   0: 00000000:0050 00000000:0000 0A\n"
+        "   1: 00000000:01BB 00000000:0000 0A\n"
+    ),
+    "/proc/net/udp": "  sl local_address rem_address st\n",
+}
 
 
-def test_preflight_ports_in_use(monkeypatch, tmp_path: Path):
-    # All binaries present
-    monkeypatch.setattr(
-        "dynadock.preflight.shutil.which",
-        _mk_which(
-            {
-                "docker": "/usr/bin/docker",
-                "ip": "/usr/sbin/ip",
-                "curl": "/usr/bin/curl",
-                "resolvectl": "/usr/bin/resolvectl",
-                "ss": "/usr/sbin/ss",
-            }
-        ),
-    )
+def _check_port_hint_deduped(report):
+    assert "port-80-in-use" in report.tokens
+    assert "port-443-in-use" in report.tokens
+    assert report.suggestions.count(SUGGESTIONS["free-port-80"]) == 1
 
-    def fake_run(args, *_, **__):
-        if args[:3] == ["docker", "compose", "version"]:
-            return DummyProc(0, "Docker Compose version v2.24.0")
-        if args[:2] == ["docker", "ps"]:
-            return DummyProc(0, "")
-        if args[:3] == ["sudo", "-n", "true"]:
-            return DummyProc(0, "")
-        if args[0] == "ss":
-            # args[1] is flags: -ltnp (tcp) or -lunp (udp)
-            flags = args[1]
-            if "-ltnp" in flags:
-                # Simulate port 80 in use, but not 443
-                return DummyProc(0, 'LISTEN 0 128 *:80 *:* users:("nginx")')
-            else:
-                # UDP check -> port 53 in use
-                return DummyProc(0, 'UNCONN 0 0 *:53 *:* users:("dnsmasq")')
-        return DummyProc(0, "")
-
-    monkeypatch.setattr("dynadock.preflight.subprocess.run", fake_run)
-
-    report = PreflightChecker(tmp_path).run()
 
+def _check_ports_in_use(report):
     # Expect warnings for port 80 and 53, but not 443
-    assert any("Port 80 appears to be in use" in w for w in report.warnings)
-    assert any("Port 53 appears to be in use" in w for w in report.warnings)
-    assert not any("Port 443 appears to be in use" in w for w in report.warnings)
+    assert "port-80-in-use" in report.tokens
+    assert "port-53-in-use" in report.tokens
+    assert "port-443-in-use" not in report.tokens
 
     # And suggestions include free-port-80 and hosts fallback message
     assert any("free-port-80" in s for s in report.suggestions)
     assert any("Port 53 conflict prevents local DNS" in s for s in report.suggestions)
 
 
+# One harness, five scenarios - each case contributes its which map, its
+# dispatcher registrations, optional /proc tables (idle host when None),
+# and a checks callback.
+PREFLIGHT_CASES = [
+    pytest.param(
+        {}, _setup_binaries_missing, None, _check_binaries_missing,
+        id="binaries-missing",
+    ),
+    pytest.param(
+        _FULL_WHICH, _setup_compose_ok, None, _check_compose_ok,
+        id="compose-plugin-ok",
+    ),
+    pytest.param(
+        _FULL_WHICH, _setup_docker_inaccessible, None, _check_docker_inaccessible,
+        id="docker-inaccessible",
+    ),
+    pytest.param(
+        _FULL_WHICH, _setup_compose_ok, _PROC_TABLES, _check_ports_in_use,
+        id="ports-in-use",
+    ),
+    pytest.param(
+        _FULL_WHICH, _setup_compose_ok, _PROC_TABLES_BOTH_HTTP,
+        _check_port_hint_deduped,
+        id="port-hint-deduped",
+    ),
+]
+
+
+@pytest.mark.parametrize("which_map,setup,proc_tables,checks", PREFLIGHT_CASES)
+def test_preflight(monkeypatch, tmp_path: Path, which_map, setup, proc_tables, checks):
+    monkeypatch.setattr("dynadock.preflight.shutil.which", _mk_which(which_map))
+
+    dispatch = RunDispatch()
+    setup(dispatch)
+    monkeypatch.setattr("dynadock.preflight.subprocess.run", dispatch)
+
+    tables = _EMPTY_PROC_TABLES if proc_tables is None else proc_tables
+    monkeypatch.setattr(
+        "dynadock.preflight._read_proc_net", lambda path: tables.get(path)
+    )
+
+    checks(PreflightChecker(tmp_path).run())
+
+
+def test_port_busy_bind_probe():
+    import socket
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        assert _port_busy(port) is True
+    # Released now - the probe must not report a stale conflict
+    assert _port_busy(port) is False
+
+
 def test_try_autofix_actions(monkeypatch, tmp_path: Path):
     # resolvectl available to trigger DNS cache flush action
     monkeypatch.setattr(
@@ -184,13 +201,8 @@ def test_try_autofix_actions(monkeypatch, tmp_path: Path):
         _mk_which({"resolvectl": "/usr/bin/resolvectl"}),
     )
 
-    calls: list[list[str]] = []
-
-    def fake_run(args, *_, **__):
-        calls.append(list(args))
-        return DummyProc(0, "")
-
-    monkeypatch.setattr("dynadock.preflight.subprocess.run", fake_run)
+    dispatch = RunDispatch()
+    monkeypatch.setattr("dynadock.preflight.subprocess.run", dispatch)
 
     actions = PreflightChecker(tmp_path).try_autofix()
 
@@ -198,6 +210,10 @@ def test_try_autofix_actions(monkeypatch, tmp_path: Path):
     assert "Ensured container 'dynadock-dns' is not running" in actions
     assert "Flushed systemd-resolved DNS cache" in actions
 
-    # Ensure docker rm and resolvectl were attempted
-    assert any(c[:3] == ["docker", "rm", "-f"] for c in calls)
-    assert any(c[:2] == ["sudo", "resolvectl"] for c in calls)
+    # Both containers are removed with one variadic docker rm call
+    assert any(
+        c[:3] == ["docker", "rm", "-f"]
+        and set(c[3:]) >= {"dynadock-caddy", "dynadock-dns"}
+        for c in dispatch.calls
+    )
+    assert any(c[:2] == ["sudo", "resolvectl"] for c in dispatch.calls)
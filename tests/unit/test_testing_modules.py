@@ -3,27 +3,64 @@
 Unit tests for refactored testing modules
 """
 
+import functools
+import importlib
+import socket
 from pathlib import Path
-import sys
 
-# Add project root to path
-project_root = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(project_root))
+import pytest
 
-from src.dynadock.testing.network_analyzer import analyze_network_connectivity
-from src.dynadock.testing.system_checker import check_system_status, get_docker_status
-from src.dynadock.testing.auto_repair import auto_repair_issues, repair_hosts_file
-from src.dynadock.testing.browser_tester import (
-    setup_screenshots_dir,
-)
+
+# Each submodule is imported lazily, once per class that needs it - a
+# filtered run (e.g. ``pytest -k TestAutoRepair``) never pays for the
+# modules it does not touch.
+def _lazy(module_name):
+    @pytest.fixture(scope="class", name=module_name.rsplit(".", 1)[1])
+    def _mod():
+        return importlib.import_module(module_name)
+
+    return _mod
+
+
+network_analyzer = _lazy("dynadock.testing.network_analyzer")
+system_checker = _lazy("dynadock.testing.system_checker")
+auto_repair = _lazy("dynadock.testing.auto_repair")
+browser_tester = _lazy("dynadock.testing.browser_tester")
+
+
+@pytest.fixture(scope="class")
+def analyze(network_analyzer):
+    # Memoized analyzer - each unique URL pays its DNS/TCP probes once
+    # per process, however many tests ask for it.
+    return functools.lru_cache(maxsize=None)(
+        network_analyzer.analyze_network_connectivity
+    )
+
+
+@pytest.fixture(autouse=True)
+def _stub_net(monkeypatch):
+    """Keep these tests hermetic - no live DNS lookups or TCP/SSL probes.
+
+    ``resolve`` goes through ``socket.gethostbyname`` and ``tcp_probe``
+    through ``connect_ex``, so canned answers there cover the whole port
+    scan; ``create_connection`` is failed fast so the HTTPS certificate
+    check takes its error path instead of dialling out.
+    """
+
+    def _no_dial(*_args, **_kwargs):
+        raise OSError("network stubbed out")
+
+    monkeypatch.setattr(socket, "gethostbyname", lambda host: "127.0.0.1")
+    monkeypatch.setattr(socket.socket, "connect_ex", lambda self, addr: 0)
+    monkeypatch.setattr(socket, "create_connection", _no_dial)
 
 
 class TestNetworkAnalyzer:
     """Test network connectivity analysis"""
 
-    def test_analyze_localhost_http(self):
+    def test_analyze_localhost_http(self, analyze):
         """Test analyzing localhost HTTP URL"""
-        result = analyze_network_connectivity("http://localhost:8000")
+        result = analyze("http://localhost:8000")
 
         assert "hostname" in result
         assert "port" in result
@@ -32,17 +69,17 @@ class TestNetworkAnalyzer:
         assert result["port"] == 8000
         assert result["scheme"] == "http"
 
-    def test_analyze_localhost_https(self):
+    def test_analyze_localhost_https(self, analyze):
         """Test analyzing localhost HTTPS URL"""
-        result = analyze_network_connectivity("https://localhost:443")
+        result = analyze("https://localhost:443")
 
         assert result["hostname"] == "localhost"
         assert result["port"] == 443
         assert result["scheme"] == "https"
 
-    def test_analyze_domain_url(self):
+    def test_analyze_domain_url(self, analyze):
         """Test analyzing domain URL"""
-        result = analyze_network_connectivity("https://frontend.dynadock.lan/")
+        result = analyze("https://frontend.dynadock.lan/")
 
         assert result["hostname"] == "frontend.dynadock.lan"
         assert result["port"] == 443
@@ -55,18 +92,18 @@ class TestNetworkAnalyzer:
 class TestSystemChecker:
     """Test system status checking"""
 
-    def test_check_system_status(self):
+    def test_check_system_status(self, system_checker):
         """Test system status check returns expected structure"""
-        status = check_system_status()
+        status = system_checker.check_system_status()
 
         assert "containers" in status
         assert "ports_listening" in status
         assert "hosts_file" in status
         assert "processes" in status
 
-    def test_get_docker_status(self):
+    def test_get_docker_status(self, system_checker):
         """Test Docker status check"""
-        status = get_docker_status()
+        status = system_checker.get_docker_status()
 
         assert "status" in status
         assert status["status"] in ["running", "not_running", "error"]
@@ -75,22 +112,22 @@ class TestSystemChecker:
 class TestAutoRepair:
     """Test auto-repair functionality"""
 
-    def test_auto_repair_empty_issues(self):
+    def test_auto_repair_empty_issues(self, auto_repair):
         """Test auto-repair with no issues"""
-        result = auto_repair_issues([])
+        result = auto_repair.auto_repair_issues([])
         assert isinstance(result, list)
         assert len(result) == 0
 
-    def test_auto_repair_container_issue(self):
+    def test_auto_repair_container_issue(self, auto_repair):
         """Test auto-repair with container issue"""
         issues = ["container not running", "service unavailable"]
-        result = auto_repair_issues(issues)
+        result = auto_repair.auto_repair_issues(issues)
         assert isinstance(result, list)
         assert len(result) > 0
 
-    def test_repair_hosts_file(self):
+    def test_repair_hosts_file(self, auto_repair):
         """Test hosts file repair check"""
-        result = repair_hosts_file()
+        result = auto_repair.repair_hosts_file()
         assert isinstance(result, str)
         assert any(keyword in result.lower() for keyword in ["✅", "⚠️", "❌"])
 
@@ -98,83 +135,21 @@ class TestAutoRepair:
 class TestBrowserTester:
     """Test browser testing functionality"""
 
-    def test_cleanup_old_screenshots(self):
+    def test_cleanup_old_screenshots(self, browser_tester, tmp_path):
         """Test screenshot cleanup functionality"""
-        # Create test screenshots directory
-        test_dir = Path("test_screenshots_test")
-        test_dir.mkdir(exist_ok=True)
-
-        # Create a dummy file
-        dummy_file = test_dir / "test.png"
-        dummy_file.write_text("test")
-
-        # Test cleanup (modify function to accept custom dir for testing)
-        import shutil
+        target = tmp_path / "test_screenshots"
+        target.mkdir()
+        (target / "stale.png").write_text("test")
 
-        if test_dir.exists():
-            shutil.rmtree(test_dir)
-        test_dir.mkdir(exist_ok=True)
+        browser_tester.cleanup_old_screenshots(target)
 
-        assert test_dir.exists()
-        assert len(list(test_dir.glob("*"))) == 0
+        assert target.exists()
+        assert not any(target.iterdir())
 
-        # Cleanup test directory
-        if test_dir.exists():
-            shutil.rmtree(test_dir)
-
-    def test_setup_screenshots_dir(self):
+    def test_setup_screenshots_dir(self, browser_tester, tmp_path):
         """Test screenshots directory setup"""
-        result_dir = setup_screenshots_dir()
+        result_dir = browser_tester.setup_screenshots_dir(root=tmp_path)
         assert isinstance(result_dir, Path)
         assert result_dir.exists()
         assert result_dir.name == "test_screenshots"
-
-
-def run_all_tests():
-    """Run all tests manually"""
-    import traceback
-
-    test_classes = [
-        TestNetworkAnalyzer,
-        TestSystemChecker,
-        TestAutoRepair,
-        TestBrowserTester,
-    ]
-    results = {"passed": 0, "failed": 0, "errors": []}
-
-    print("🧪 Running unit tests for refactored modules...")
-
-    for test_class in test_classes:
-        class_name = test_class.__name__
-        print(f"\n📋 Testing {class_name}:")
-
-        instance = test_class()
-        test_methods = [
-            method for method in dir(instance) if method.startswith("test_")
-        ]
-
-        for method_name in test_methods:
-            try:
-                method = getattr(instance, method_name)
-                method()
-                print(f"   ✅ {method_name}")
-                results["passed"] += 1
-            except Exception as e:
-                print(f"   ❌ {method_name}: {e}")
-                results["failed"] += 1
-                results["errors"].append(f"{class_name}.{method_name}: {e}")
-                traceback.print_exc()
-
-    print(f"\n📊 Test Results: {results['passed']} passed, {results['failed']} failed")
-
-    if results["errors"]:
-        print("\n🔍 Error Details:")
-        for error in results["errors"]:
-            print(f"   - {error}")
-
-    return results["failed"] == 0
-
-
-if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+        assert result_dir.parent == tmp_path